@@ -1,6 +1,8 @@
 import logging
+import warnings
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -18,10 +20,12 @@ from traveltime_drive_time_comparisons.config import Provider, Providers
 CASE_CATEGORY_COLUMN = Fields.CASE_CATEGORY
 
 
+@lru_cache(maxsize=None)
 def absolute_error(target: str, api_provider: str) -> str:
     return f"absolute_error_{target}_to_{api_provider}"
 
 
+@lru_cache(maxsize=None)
 def relative_error(target: str, api_provider: str) -> str:
     return f"error_percentage_{target}_to_{api_provider}"
 
@@ -41,41 +45,56 @@ def log_results(
     target_name = target_provider.name
     capitalized_target = get_capitalized_provider_name(target_name)
     logging.info(f"Comparing {capitalized_target} to other providers:")
-    for name in api_providers.all_names():
-        if name != target_name:
-            capitalized_provider = get_capitalized_provider_name(name)
-            logging.info(
-                f"\tMean relative error compared to {capitalized_provider} "
-                f"API: {results_with_differences[relative_error(target_name, name)].mean():.2f}%"
-            )
-            quantile_errors = calculate_quantiles(
-                results_with_differences, quantile, target_name, name
-            )
-            logging.info(
-                f"\t{int(quantile * 100)}% of {capitalized_target} results differ from {capitalized_provider} API "
-                f"by less than {int(quantile_errors.relative_error)}%"
-            )
 
+    other_names = [name for name in api_providers.all_names() if name != target_name]
+    relative_error_columns = [relative_error(target_name, name) for name in other_names]
 
-def format_results_for_csv(results_with_differences: DataFrame) -> DataFrame:
-    formatted_results = results_with_differences.copy()
+    # Aggregate every provider column in one pass instead of one scan per provider
+    relative_errors = results_with_differences[relative_error_columns]
+    mean_errors = relative_errors.mean()
 
-    # Drop all columns containing "absolute_error"
-    absolute_error_columns = [
-        col for col in formatted_results.columns if "absolute_error" in col
-    ]
-    formatted_results = formatted_results.drop(columns=absolute_error_columns)
+    for name, column in zip(other_names, relative_error_columns):
+        capitalized_provider = get_capitalized_provider_name(name)
+        # Same quantile path as calculate_quantiles' other callers
+        quantile_errors = calculate_quantiles(
+            results_with_differences, quantile, target_name, name
+        )
+        logging.info(
+            f"\tMean relative error compared to {capitalized_provider} "
+            f"API: {mean_errors[column]:.2f}%"
+        )
+        logging.info(
+            f"\t{int(quantile * 100)}% of {capitalized_target} results differ from {capitalized_provider} API "
+            f"by less than {quantile_errors.relative_error}%"
+        )
+
+
+def format_results_for_csv(
+    results_with_differences: DataFrame,
+    absolute_error_columns: Optional[List[str]] = None,
+    relative_error_columns: Optional[List[str]] = None,
+) -> DataFrame:
+    # Drop all columns containing "absolute_error", unless the caller already
+    # knows which columns it generated. Dropping builds the new frame, so no
+    # separate defensive copy of the whole input is needed.
+    if absolute_error_columns is None:
+        absolute_error_columns = [
+            col for col in results_with_differences.columns if "absolute_error" in col
+        ]
+    formatted_results = results_with_differences.drop(columns=absolute_error_columns)
     # Convert all relative error columns to int
-    relative_error_columns = [
-        col for col in formatted_results.columns if "error_percentage" in col
-    ]
-    for col in relative_error_columns:
-        # Replace inf with NaN, round to int, then convert to nullable Int64
-        formatted_results[col] = (
-            formatted_results[col]
+    if relative_error_columns is None:
+        relative_error_columns = [
+            col for col in formatted_results.columns if "error_percentage" in col
+        ]
+    if relative_error_columns:
+        # Replace inf with NaN, round to int, then convert the whole block to
+        # nullable Int32 at once
+        formatted_results[relative_error_columns] = (
+            formatted_results[relative_error_columns]
             .replace([float("inf"), float("-inf")], float("nan"))
             .round()
-            .astype("Int64")
+            .astype("Int32")
         )
 
     if CASE_CATEGORY_COLUMN in formatted_results.columns:
@@ -93,54 +112,78 @@ def run_analysis(
     api_providers: Providers,
     debug: bool = False,
 ):
-    accumulated_results = results.copy()
-    for target_provider in api_providers.all_providers():
-        results_with_differences = calculate_differences(
-            results, target_provider, api_providers
-        )
+    names = api_providers.all_names()
+    travel_times = _travel_time_arrays(results, names)
 
-        for col in results_with_differences.columns:
-            if col not in accumulated_results.columns:
-                accumulated_results[col] = results_with_differences[col]
+    error_columns: Dict[str, np.ndarray] = {}
+    for target_name in names:
+        error_columns.update(_calculate_error_columns(travel_times, target_name))
 
-        if debug:
-            log_results(
-                results_with_differences, quantile, target_provider, api_providers
-            )
+    # Add every error column in a single step instead of copying per provider
+    accumulated_results = results.assign(**error_columns)
+
+    if debug:
+        for target_provider in api_providers.all_providers():
+            log_results(accumulated_results, quantile, target_provider, api_providers)
 
     logging.info(f"Detailed results can be found in {output_file} file")
 
+    pairs = [(target, name) for target in names for name in names if name != target]
     formatted_results = format_results_for_csv(
-        accumulated_results
-    )  # Use accumulated_results here
+        accumulated_results,
+        [absolute_error(target, name) for target, name in pairs],
+        [relative_error(target, name) for target, name in pairs],
+    )
 
     formatted_results.to_csv(output_file, index=False)
 
 
-def calculate_differences(
-    results: DataFrame, target_provider: Provider, api_providers: Providers
-) -> DataFrame:
-    results_with_differences = results.copy()
+def _travel_time_arrays(results: DataFrame, names: List[str]) -> Dict[str, np.ndarray]:
+    # Travel times are whole seconds, which float32 holds exactly while
+    # halving the memory the error arithmetic has to stream through
+    return {
+        name: results[Fields.TRAVEL_TIME[name]].to_numpy(
+            dtype=np.float32, na_value=np.nan
+        )
+        for name in names
+    }
 
-    target_name = target_provider.name
-    for name in api_providers.all_names():
-        if name != target_name:
-            absolute_error_col = absolute_error(target_name, name)
-            relative_error_col = relative_error(target_name, name)
 
-            results_with_differences[absolute_error_col] = abs(
-                results[Fields.TRAVEL_TIME[name]]
-                - results[Fields.TRAVEL_TIME[target_name]]
-            )
+def _calculate_error_columns(
+    travel_times: Dict[str, np.ndarray], target_name: str
+) -> Dict[str, np.ndarray]:
+    target_times = travel_times[target_name]
 
-            denominator = results_with_differences[Fields.TRAVEL_TIME[name]]
-            results_with_differences[relative_error_col] = (
-                results_with_differences[absolute_error_col]
-                / denominator.replace(0, float("nan"))
-                * 100
+    error_columns = {}
+    for name, provider_times in travel_times.items():
+        if name != target_name:
+            # Reuse the freshly allocated buffers in place to avoid temporaries
+            absolute_errors = provider_times - target_times
+            np.abs(absolute_errors, out=absolute_errors)
+            # Percentages are not whole numbers, so compute them in float64
+            relative_errors = np.full(absolute_errors.shape, np.nan)
+            np.divide(
+                absolute_errors,
+                provider_times,
+                out=relative_errors,
+                where=provider_times != 0,
+                dtype=np.float64,
             )
+            relative_errors *= 100
+
+            error_columns[absolute_error(target_name, name)] = absolute_errors
+            error_columns[relative_error(target_name, name)] = relative_errors
+
+    return error_columns
+
 
-    return results_with_differences
+def calculate_differences(
+    results: DataFrame, target_provider: Provider, api_providers: Providers
+) -> DataFrame:
+    travel_times = _travel_time_arrays(results, api_providers.all_names())
+    return results.assign(
+        **_calculate_error_columns(travel_times, target_provider.name)
+    )
 
 
 def calculate_quantiles(
@@ -149,12 +192,14 @@ def calculate_quantiles(
     target_name,
     api_provider_name: str,
 ) -> QuantileErrorResult:
-    quantile_absolute_error = results_with_differences[
-        absolute_error(target_name, api_provider_name)
-    ].quantile(quantile, "higher")
-    quantile_relative_error = results_with_differences[
-        relative_error(target_name, api_provider_name)
-    ].quantile(quantile, "higher")
+    quantile_absolute_error = _higher_quantile(
+        results_with_differences[absolute_error(target_name, api_provider_name)],
+        quantile,
+    )
+    quantile_relative_error = _higher_quantile(
+        results_with_differences[relative_error(target_name, api_provider_name)],
+        quantile,
+    )
 
     # Handle NaN quantiles (when all values are NaN)
     abs_err = int(quantile_absolute_error) if pd.notna(quantile_absolute_error) else 0
@@ -163,29 +208,15 @@ def calculate_quantiles(
     return QuantileErrorResult(abs_err, rel_err)
 
 
-def _calculate_provider_accuracy(
-    provider_value: float, all_values: List[float], provider_index: int
-) -> float:
-    competitors_sum = sum(
-        competitor_value
-        for competitor_index, competitor_value in enumerate(all_values)
-        if competitor_index != provider_index
-    )
-    competitors_average = competitors_sum / (len(all_values) - 1)
-    accuracy = 1 - abs(provider_value - competitors_average) / provider_value
-    return accuracy * 100
-
-
-def _get_provider_comparison(
-    provider_name: str,
-    provider_value: float,
-    all_values: List[float],
-    provider_index: int,
-) -> Tuple[str, float]:
-    return (
-        get_capitalized_provider_name(provider_name),
-        _calculate_provider_accuracy(provider_value, all_values, provider_index),
-    )
+def _higher_quantile(values: pd.Series, quantile: float) -> float:
+    # Picks the same element as Series.quantile(quantile, "higher"), but with a
+    # partial sort (introselect) instead of going through pandas
+    array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    array = array[~np.isnan(array)]
+    if array.size == 0:
+        return np.nan
+    index = int(np.ceil(quantile * (array.size - 1)))
+    return float(np.partition(array, index)[index])
 
 
 def calculate_accuracies(data: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
@@ -198,44 +229,42 @@ def calculate_accuracies(data: pd.DataFrame, columns: Dict[str, str]) -> pd.Data
         print("Warning: Google data not found. Cannot generate baseline summary.")
         return pd.DataFrame()
 
-    baseline_col = existing_fields[google_key]
-
-    results = []
-
-    for provider_key, provider_col in existing_fields.items():
-        pretty_name = get_capitalized_provider_name(provider_key)
-
-        # Handle Google as the baseline case.
-        if provider_key == google_key:
-            accuracy_score = 100.0
-            speed_index = 100.0
-        # Handle all other providers.
-        else:
-            safe_baseline = data[baseline_col].replace(0, np.nan)
-            percentage_error = (
-                (data[provider_col] - data[baseline_col]) / safe_baseline
-            ) * 100
-
-            # Transform the original metrics into the new scores
-            mean_abs_error = np.mean(np.abs(percentage_error))
-            mean_bias = np.mean(percentage_error)
-
-            accuracy_score = 100 - mean_abs_error
-            speed_index = 100 + mean_bias
-
-        results.append(
-            {
-                PROVIDER_COLUMN: pretty_name,
-                ACCURACY_SCORE_COLUMN: round(accuracy_score, 2),
-                RELATIVE_TIME_COLUMN: round(speed_index, 2),
-            }
-        )
-
-    if not results:
-        return pd.DataFrame()
+    provider_keys = list(existing_fields)
+    values = data[list(existing_fields.values())].to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    google_index = provider_keys.index(google_key)
+    baseline = values[:, google_index, np.newaxis]
+    # Divide once per row, then scale every provider by the same factor
+    percentage_scale = np.divide(
+        100.0, baseline, out=np.full_like(baseline, np.nan), where=baseline != 0
+    )
 
-    summary_df = pd.DataFrame(results)
+    # Work in place on the single (rows, providers) buffer
+    percentage_errors = values - baseline
+    percentage_errors *= percentage_scale
+    absolute_percentage_errors = np.abs(percentage_errors)
+
+    # Transform the original metrics into the new scores, one value per provider
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)  # all-NaN columns
+        mean_abs_errors = np.nanmean(absolute_percentage_errors, axis=0)
+        mean_biases = np.nanmean(percentage_errors, axis=0)
+
+    accuracy_scores = 100 - mean_abs_errors
+    speed_indices = 100 + mean_biases
+    # Google is the baseline, so it scores 100 on both by definition
+    accuracy_scores[google_index] = 100.0
+    speed_indices[google_index] = 100.0
+
+    summary_df = pd.DataFrame(
+        {
+            PROVIDER_COLUMN: [get_capitalized_provider_name(k) for k in provider_keys],
+            ACCURACY_SCORE_COLUMN: np.round(accuracy_scores, 2),
+            RELATIVE_TIME_COLUMN: np.round(speed_indices, 2),
+        }
+    )
     # Sort by the new Accuracy Score, with higher values being better (ascending=False)
     return summary_df.sort_values(
-        by=ACCURACY_SCORE_COLUMN, ascending=False
-    ).reset_index(drop=True)
+        by=ACCURACY_SCORE_COLUMN, ascending=False, ignore_index=True
+    )
@@ -1,14 +1,30 @@
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, List, Optional, Tuple
 
+import aiohttp
 from aiolimiter import AsyncLimiter
 from traveltimepy.requests.common import Coordinates
 
 from traveltime_drive_time_comparisons.config import Mode
 
+MAX_CONNECTIONS = 100
+DNS_CACHE_TTL_SECONDS = 300
+
+# Upper bound on requests in flight at once to each provider. Every handler gets its
+# own budget, so a slow provider can't tie up slots the others would use.
+MAX_CONCURRENT_REQUESTS_PER_PROVIDER = 100
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.5
+# Failures worth another attempt: refused or dropped connections and timeouts
+RETRYABLE_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
 
 @dataclass
 class SnappedCoordinates:
@@ -18,7 +34,7 @@ class SnappedCoordinates:
     destination_lng: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class RequestResult:
     travel_time: Optional[int]
     distance: Optional[int] = None
@@ -26,9 +42,19 @@ class RequestResult:
     warnings: List[str] = field(default_factory=list)
 
 
+# Shared by every failure path; results are never mutated once returned
+EMPTY_RESULT = RequestResult(None)
+
+
 class BaseRequestHandler(ABC):
     _rate_limiter: AsyncLimiter
     _just_checking_if_it_complains: str
+    _session: Optional[aiohttp.ClientSession] = None
+    _concurrency_limit: Optional[asyncio.Semaphore] = None
+
+    # Fail fast on hosts that don't accept the connection or stop sending data,
+    # rather than waiting out the whole request budget
+    default_timeout = aiohttp.ClientTimeout(total=60, connect=5, sock_read=30)
 
     @abstractmethod
     async def send_request(
@@ -40,11 +66,69 @@ class BaseRequestHandler(ABC):
     ) -> RequestResult:
         pass
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session is bound to the running event loop,
+        # then kept so connections are reused across requests. A session closed
+        # underneath us is replaced rather than failing every later request.
+        if self._session is None or self._session.closed:
+            self._session = create_client_session(self.default_timeout)
+        return self._session
+
+    @asynccontextmanager
+    async def _throttled(self) -> AsyncIterator[None]:
+        # Every attempt sent to the provider, retries included, goes through here.
+        # The rate limiter slot is taken first, so requests waiting on the rate
+        # limit don't hold concurrency slots.
+        if self._concurrency_limit is None:
+            # Created lazily so the semaphore is bound to the running event loop
+            self._concurrency_limit = asyncio.Semaphore(
+                MAX_CONCURRENT_REQUESTS_PER_PROVIDER
+            )
+        async with self.rate_limiter, self._concurrency_limit:
+            yield
+
+    async def _fetch(self, method: str, url: str, **kwargs: Any) -> Tuple[int, bytes]:
+        # Transient failures are retried with exponential backoff, so a handful
+        # of them don't leave gaps that need the whole batch rerun. The backoff
+        # sleeps outside the throttle, so waiting retries hold no slots.
+        attempt = 1
+        while True:
+            try:
+                async with (
+                    self._throttled(),
+                    self._get_session().request(method, url, **kwargs) as response,
+                ):
+                    body = await response.read()
+                    if response.status < 500 or attempt == MAX_ATTEMPTS:
+                        return response.status, body
+            except RETRYABLE_ERRORS:
+                if attempt == MAX_ATTEMPTS:
+                    raise
+            await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            attempt += 1
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     @property
     def rate_limiter(self) -> AsyncLimiter:
         return self._rate_limiter
 
 
+def create_client_session(timeout: aiohttp.ClientTimeout) -> aiohttp.ClientSession:
+    # Every handler talks to a single host, so the per-host cap is what bounds
+    # the number of sockets opened against a provider. The host's address is
+    # resolved once and reused for the rest of a typical collection run.
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONNECTIONS,
+        limit_per_host=MAX_CONNECTIONS,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+    )
+    return aiohttp.ClientSession(timeout=timeout, connector=connector)
+
+
 def create_async_limiter(max_rpm: int) -> AsyncLimiter:
     # Convert max_rpm to requests per second
     rps = max_rpm / 60
@@ -60,3 +144,19 @@ def create_async_limiter(max_rpm: int) -> AsyncLimiter:
         max_rate = rps
 
     return AsyncLimiter(max_rate=max_rate, time_period=time_period)
+
+
+def cached_time_formatter(
+    format_time: Callable[[datetime], str],
+) -> Callable[[datetime], str]:
+    # The same few departure times are formatted for every origin/destination
+    # pair. Aware datetimes for the same instant compare equal regardless of
+    # their offset, so the offset is part of the cache key.
+    @lru_cache(maxsize=1024)
+    def cached_format(time: datetime, utc_offset: Optional[timedelta]) -> str:
+        return format_time(time)
+
+    def formatter(time: datetime) -> str:
+        return cached_format(time, time.utcoffset())
+
+    return formatter
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 from traveltime_drive_time_comparisons.common import (
     TOMTOM_API,
@@ -7,11 +7,11 @@ from traveltime_drive_time_comparisons.common import (
     TRAVELTIME_API,
     GOOGLE_API,
 )
-from traveltime_drive_time_comparisons.config import Provider, Providers
+from traveltime_drive_time_comparisons.config import Providers
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
     BaseRequestHandler,
 )
-from traveltime_drive_time_comparisons.api_requests.google_handler_new import (
+from traveltime_drive_time_comparisons.api_requests.google_handler import (
     GoogleRequestHandler,
 )
 from traveltime_drive_time_comparisons.api_requests.tomtom_handler import (
@@ -27,49 +27,32 @@ from traveltime_drive_time_comparisons.api_requests.traveltime_handler import (
     TravelTimeRequestHandler,
 )
 
+_HANDLER_CLASSES: Dict[str, Callable[[str, int, Optional[str]], BaseRequestHandler]] = {
+    GOOGLE_API: GoogleRequestHandler,
+    TOMTOM_API: TomTomRequestHandler,
+    HERE_API: HereRequestHandler,
+    MAPBOX_API: MapboxRequestHandler,
+}
 
-def initialize_request_handlers(providers: Providers) -> Dict[str, BaseRequestHandler]:
-    def create_google_handler(provider: Provider):
-        return GoogleRequestHandler(
-            provider.credentials.api_key, provider.max_rpm, provider.api_endpoint
-        )
-
-    def create_tomtom_handler(provider: Provider):
-        return TomTomRequestHandler(
-            provider.credentials.api_key, provider.max_rpm, provider.api_endpoint
-        )
-
-    def create_here_handler(provider: Provider):
-        return HereRequestHandler(
-            provider.credentials.api_key, provider.max_rpm, provider.api_endpoint
-        )
-
-    def create_mapbox_handler(provider: Provider):
-        return MapboxRequestHandler(
-            provider.credentials.api_key, provider.max_rpm, provider.api_endpoint
-        )
 
-    def create_traveltime_handler(provider: Provider):
-        return TravelTimeRequestHandler(
-            provider.credentials.app_id,
-            provider.credentials.api_key,
-            provider.max_rpm,
-            provider.api_endpoint,
-        )
-
-    handler_mapping = {
-        GOOGLE_API: create_google_handler,
-        TOMTOM_API: create_tomtom_handler,
-        HERE_API: create_here_handler,
-        MAPBOX_API: create_mapbox_handler,
-    }
-
-    handlers = {}
+def initialize_request_handlers(providers: Providers) -> Dict[str, BaseRequestHandler]:
+    handlers: Dict[str, BaseRequestHandler] = {}
     for competitor in providers.competitors:
-        if competitor.name in handler_mapping:
-            handlers[competitor.name] = handler_mapping[competitor.name](competitor)
+        handler_class = _HANDLER_CLASSES.get(competitor.name)
+        if handler_class is not None:
+            handlers[competitor.name] = handler_class(
+                competitor.credentials.api_key,
+                competitor.max_rpm,
+                competitor.api_endpoint,
+            )
 
     # Always add TRAVELTIME_API handler
-    handlers[TRAVELTIME_API] = create_traveltime_handler(providers.base)
+    base = providers.base
+    handlers[TRAVELTIME_API] = TravelTimeRequestHandler(
+        base.credentials.app_id,
+        base.credentials.api_key,
+        base.max_rpm,
+        base.api_endpoint,
+    )
 
     return handlers
@@ -1,39 +1,60 @@
-# For Google Directions API
+# Google Routes API handler (replaces legacy Directions API)
 
 import logging
 from datetime import datetime
+from typing import List, Optional
 
-import aiohttp
+import orjson
 from traveltimepy.requests.common import Coordinates
 
 from traveltime_drive_time_comparisons.config import Mode
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    EMPTY_RESULT,
     BaseRequestHandler,
     RequestResult,
     SnappedCoordinates,
+    cached_time_formatter,
     create_async_limiter,
 )
 
 logger = logging.getLogger(__name__)
 
+_format_departure_time = cached_time_formatter(datetime.isoformat)
+
 
 class GoogleApiError(Exception):
     pass
 
 
 class GoogleRequestHandler(BaseRequestHandler):
-    DURATION_IN_TRAFFIC = "duration_in_traffic"
-    DURATION = "duration"
-    DEFAULT_API_ENDPOINT = "https://maps.googleapis.com"
-    ROUTING_PATH = "/maps/api/directions/json"
-
-    default_timeout = aiohttp.ClientTimeout(total=60)
+    DEFAULT_API_ENDPOINT = "https://routes.googleapis.com"
+    ROUTING_PATH = "/directions/v2:computeRoutes"
+
+    FIELD_MASK = ",".join(
+        [
+            "routes.duration",
+            "routes.distanceMeters",
+            "routes.warnings",
+            "routes.legs.startLocation",
+            "routes.legs.endLocation",
+        ]
+    )
+
+    STATIC_BODY_FIELDS = {
+        "routingPreference": "TRAFFIC_AWARE_OPTIMAL",
+        "trafficModel": "BEST_GUESS",
+    }
 
     def __init__(self, api_key, max_rpm, api_endpoint):
         self.api_key = api_key
         self._rate_limiter = create_async_limiter(max_rpm)
         base_url = api_endpoint or self.DEFAULT_API_ENDPOINT
         self.routing_url = base_url + self.ROUTING_PATH
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-Goog-Api-Key": self.api_key,
+            "X-Goog-FieldMask": self.FIELD_MASK,
+        }
 
     async def send_request(
         self,
@@ -42,65 +63,88 @@ class GoogleRequestHandler(BaseRequestHandler):
         departure_time: datetime,
         mode: Mode,
     ) -> RequestResult:
-        params = {
-            "origin": "{},{}".format(origin.lat, origin.lng),
-            "destination": "{},{}".format(destination.lat, destination.lng),
-            "mode": get_google_travel_mode(mode),
-            "traffic_model": "best_guess",
-            "departure_time": int(departure_time.timestamp()),
-            "key": self.api_key,
+        body = {
+            **self.STATIC_BODY_FIELDS,
+            "origin": {
+                "location": {
+                    "latLng": {
+                        "latitude": origin.lat,
+                        "longitude": origin.lng,
+                    }
+                }
+            },
+            "destination": {
+                "location": {
+                    "latLng": {
+                        "latitude": destination.lat,
+                        "longitude": destination.lng,
+                    }
+                }
+            },
+            "travelMode": get_google_travel_mode(mode),
+            "departureTime": _format_departure_time(departure_time),
         }
+
         try:
-            async with (
-                aiohttp.ClientSession(timeout=self.default_timeout) as session,
-                session.get(self.routing_url, params=params) as response,
-            ):
-                data = await response.json()
-                status = data["status"]
-
-                if status == "OK":
-                    route = data.get("routes", [{}])[0]
-                    leg = route.get("legs", [{}])[0]
-
-                    if not leg:
-                        raise GoogleApiError(
-                            "No route found between origin and destination."
-                        )
-
-                    travel_time = leg.get(
-                        self.DURATION_IN_TRAFFIC, leg.get(self.DURATION)
-                    )["value"]
-
-                    distance = leg.get("distance", {}).get("value")
-
-                    start = leg.get("start_location", {})
-                    end = leg.get("end_location", {})
-                    snapped = SnappedCoordinates(
-                        origin_lat=start.get("lat"),
-                        origin_lng=start.get("lng"),
-                        destination_lat=end.get("lat"),
-                        destination_lng=end.get("lng"),
-                    )
-                    return RequestResult(
-                        travel_time=travel_time,
-                        distance=distance,
-                        snapped_coords=snapped,
-                    )
-                else:
-                    error_message = data.get("error_message", "")
-                    logger.error(
-                        f"Error in Google API response: {status} - {error_message}"
-                    )
-                    return RequestResult(None)
+            _, response_body = await self._fetch(
+                "POST", self.routing_url, data=orjson.dumps(body), headers=self._headers
+            )
+            data = orjson.loads(response_body)
+
+            if "error" in data:
+                error = data["error"]
+                logger.error(
+                    "Error in Google Routes API response: %s - %s",
+                    error.get("status"),
+                    error.get("message"),
+                )
+                return EMPTY_RESULT
+
+            routes = data.get("routes", [])
+            if not routes:
+                logger.error("No routes returned from Google Routes API")
+                return EMPTY_RESULT
+
+            route = routes[0]
+
+            duration_str = route.get("duration", "0s")
+            # Durations look like "123s", and may carry fractional seconds
+            travel_time = int(float(duration_str[:-1]))
+
+            distance = route.get("distanceMeters")
+
+            warnings: List[str] = route.get("warnings", [])
+
+            try:
+                leg = route["legs"][0]
+                start_loc = leg["startLocation"]["latLng"]
+                end_loc = leg["endLocation"]["latLng"]
+                snapped: Optional[SnappedCoordinates] = SnappedCoordinates(
+                    origin_lat=start_loc["latitude"],
+                    origin_lng=start_loc["longitude"],
+                    destination_lat=end_loc["latitude"],
+                    destination_lng=end_loc["longitude"],
+                )
+            except (KeyError, IndexError, TypeError):
+                snapped = None
+
+            return RequestResult(
+                travel_time=travel_time,
+                distance=distance,
+                snapped_coords=snapped,
+                warnings=warnings,
+            )
+
         except Exception as e:
-            logger.error(f"Exception during requesting Google API, {e}")
-            return RequestResult(None)
+            logger.error("Exception during requesting Google Routes API: %s", e)
+            return EMPTY_RESULT
+
+
+_GOOGLE_TRAVEL_MODES = {Mode.DRIVING: "DRIVE", Mode.PUBLIC_TRANSPORT: "TRANSIT"}
 
 
 def get_google_travel_mode(mode: Mode) -> str:
-    if mode == Mode.DRIVING:
-        return "driving"
-    elif mode == Mode.PUBLIC_TRANSPORT:
-        return "transit"
-    else:
-        raise ValueError(f"Unsupported mode: `{mode.value}`")
+    try:
+        return _GOOGLE_TRAVEL_MODES[mode]
+    except KeyError:
+        raise ValueError(f"Unsupported mode: `{mode.value}`") from None
@@ -1,19 +1,25 @@
 import logging
 from datetime import datetime
 
-import aiohttp
+import orjson
 from traveltimepy.requests.common import Coordinates
 
 from traveltime_drive_time_comparisons.config import Mode
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    EMPTY_RESULT,
     BaseRequestHandler,
     RequestResult,
     SnappedCoordinates,
+    cached_time_formatter,
     create_async_limiter,
 )
 
 logger = logging.getLogger(__name__)
 
+_format_departure_time = cached_time_formatter(
+    lambda time: time.replace(tzinfo=None).isoformat(timespec="seconds")
+)
+
 
 class HereApiError(Exception):
     pass
@@ -23,13 +29,15 @@ class HereRequestHandler(BaseRequestHandler):
     DEFAULT_API_ENDPOINT = "https://router.hereapi.com"
     ROUTING_PATH = "/v8/routes"
 
-    default_timeout = aiohttp.ClientTimeout(total=60)
-
     def __init__(self, api_key, max_rpm, api_endpoint):
         self.api_key = api_key
         self._rate_limiter = create_async_limiter(max_rpm)
         base_url = api_endpoint or self.DEFAULT_API_ENDPOINT
         self.routing_url = base_url + self.ROUTING_PATH
+        self._base_params = {
+            "return": "summary",
+            "apikey": self.api_key,
+        }
 
     async def send_request(
         self,
@@ -39,81 +47,83 @@ class HereRequestHandler(BaseRequestHandler):
         mode: Mode,
     ) -> RequestResult:
         params = {
+            **self._base_params,
             "transportMode": get_here_specific_mode(mode),
             "origin": f"{origin.lat},{origin.lng}",
             "destination": f"{destination.lat},{destination.lng}",
-            "return": "summary",
-            "departureTime": departure_time.strftime("%Y-%m-%dT%H:%M:%S"),
-            "apikey": self.api_key,
+            "departureTime": _format_departure_time(departure_time),
         }
         try:
-            async with (
-                aiohttp.ClientSession(timeout=self.default_timeout) as session,
-                session.get(self.routing_url, params=params) as response,
-            ):
-                data = await response.json()
-                if response.status == 200:
-                    first_route = data["routes"][0]
-
-                    if not first_route:
-                        raise HereApiError(
-                            "No route found between origin and destination."
+            status, response_body = await self._fetch(
+                "GET", self.routing_url, params=params
+            )
+            if status == 200:
+                data = orjson.loads(response_body)
+                first_route = data["routes"][0]
+
+                if not first_route:
+                    raise HereApiError("No route found between origin and destination.")
+
+                sections = first_route["sections"]
+                # I think for a simple routing request, there should only be one section. But just in case
+                # I'm taking the sum of all sections
+                total_duration = sum(
+                    section["summary"]["duration"] for section in sections
+                )
+                total_distance = sum(
+                    section["summary"]["length"] for section in sections
+                )
+
+                # For some reason, HERE provider returns 0 duration, 0 length
+                # for some routes in the mountains, but doesn't indicate anywhere
+                # that it failed. Returning 0 fails `asType(int)` conversion later.
+                # Example route in UK where this happens:
+                # "58.61966879999991, -5.0040819999999995","58.578906999999894, -4.880025099999999"
+                if total_duration == 0:
+                    return EMPTY_RESULT
+
+                snapped = None
+                if sections:
+                    first_section = sections[0]
+                    last_section = sections[-1]
+                    departure = first_section.get("departure", {}).get("place", {})
+                    arrival = last_section.get("arrival", {}).get("place", {})
+                    if departure and arrival:
+                        snapped = SnappedCoordinates(
+                            origin_lat=departure.get("location", {}).get("lat"),
+                            origin_lng=departure.get("location", {}).get("lng"),
+                            destination_lat=arrival.get("location", {}).get("lat"),
+                            destination_lng=arrival.get("location", {}).get("lng"),
                         )
 
-                    sections = first_route["sections"]
-                    # I think for a simple routing request, there should only be one section. But just in case
-                    # I'm taking the sum of all sections
-                    total_duration = sum(
-                        section["summary"]["duration"] for section in sections
-                    )
-                    total_distance = sum(
-                        section["summary"]["length"] for section in sections
-                    )
-
-                    # For some reason, HERE provider returns 0 duration, 0 length
-                    # for some routes in the mountains, but doesn't indicate anywhere
-                    # that it failed. Returning 0 fails `asType(int)` conversion later.
-                    # Example route in UK where this happens:
-                    # "58.61966879999991, -5.0040819999999995","58.578906999999894, -4.880025099999999"
-                    if total_duration == 0:
-                        return RequestResult(None)
-
-                    snapped = None
-                    if sections:
-                        first_section = sections[0]
-                        last_section = sections[-1]
-                        departure = first_section.get("departure", {}).get("place", {})
-                        arrival = last_section.get("arrival", {}).get("place", {})
-                        if departure and arrival:
-                            snapped = SnappedCoordinates(
-                                origin_lat=departure.get("location", {}).get("lat"),
-                                origin_lng=departure.get("location", {}).get("lng"),
-                                destination_lat=arrival.get("location", {}).get("lat"),
-                                destination_lng=arrival.get("location", {}).get("lng"),
-                            )
-
-                    return RequestResult(
-                        travel_time=total_duration,
-                        distance=total_distance,
-                        snapped_coords=snapped,
-                    )
-                else:
-                    error_message = data.get("detailedError", "")
-                    logger.error(
-                        f"Error in HERE API response: {response.status} - {error_message}"
-                    )
-                    return RequestResult(None)
+                return RequestResult(
+                    travel_time=total_duration,
+                    distance=total_distance,
+                    snapped_coords=snapped,
+                )
+            else:
+                # Error bodies are only logged, and may not be JSON at all
+                logger.error(
+                    "Error in HERE API response: %s - %s",
+                    status,
+                    response_body.decode(errors="replace"),
+                )
+                return EMPTY_RESULT
         except Exception as e:
-            logger.error(f"Exception during requesting HERE API, {e}")
-            return RequestResult(None)
+            logger.error("Exception during requesting HERE API, %s", e)
+            return EMPTY_RESULT
+
+
+_HERE_MODES = {
+    Mode.DRIVING: "car",
+    # HERE doesn't have a general mode for transit / PT
+    # TODO: figure out how to compare PT modes across different providers
+    Mode.PUBLIC_TRANSPORT: "bus",
+}
 
 
 def get_here_specific_mode(mode: Mode) -> str:
-    if mode == Mode.DRIVING:
-        return "car"
-    elif mode == Mode.PUBLIC_TRANSPORT:
-        return "bus"  # HERE doesn't have a general mode for transit / PT
-        # TODO: figure out how to compare PT modes across different providers
-
-    else:
-        raise ValueError(f"Unsupported mode: `{mode.value}`")
+    try:
+        return _HERE_MODES[mode]
+    except KeyError:
+        raise ValueError(f"Unsupported mode: `{mode.value}`") from None
@@ -1,19 +1,25 @@
 import logging
 from datetime import datetime
 
-import aiohttp
+import orjson
 from traveltimepy.requests.common import Coordinates
 
 from traveltime_drive_time_comparisons.config import Mode
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    EMPTY_RESULT,
     BaseRequestHandler,
     RequestResult,
     SnappedCoordinates,
+    cached_time_formatter,
     create_async_limiter,
 )
 
 logger = logging.getLogger(__name__)
 
+_format_departure_time = cached_time_formatter(
+    lambda time: time.replace(tzinfo=None).isoformat(timespec="seconds") + "Z"
+)
+
 
 class MapboxApiError(Exception):
     pass
@@ -23,14 +29,20 @@ class MapboxRequestHandler(BaseRequestHandler):
     DEFAULT_API_ENDPOINT = "https://api.mapbox.com"
     ROUTING_PATH = "/directions/v5/mapbox"
 
-    default_timeout = aiohttp.ClientTimeout(total=60)
-
     def __init__(self, api_key, max_rpm, api_endpoint):
         self.api_key = api_key
         self._rate_limiter = create_async_limiter(max_rpm)
 
         base_url = api_endpoint or self.DEFAULT_API_ENDPOINT
         self.routing_url = base_url + self.ROUTING_PATH
+        self._mode_urls = {
+            Mode.DRIVING: f"{self.routing_url}/{get_mapbox_specific_mode(Mode.DRIVING)}"
+        }
+        self._base_params = {
+            "access_token": self.api_key,
+            "exclude": "ferry",  # by default I think it includes ferries, but for our API we use just driving, without ferries
+            "overview": "false",  # only duration, distance and waypoints are read, so skip the route geometry
+        }
 
     async def send_request(
         self,
@@ -40,63 +52,69 @@ class MapboxRequestHandler(BaseRequestHandler):
         mode: Mode = Mode.DRIVING,
     ) -> RequestResult:
         route = f"{origin.lng},{origin.lat};{destination.lng},{destination.lat}"  # for Mapbox lat/lng are flipped!
-        transport_mode = get_mapbox_specific_mode(mode)
+        mode_url = self._mode_urls.get(mode)
+        if mode_url is None:
+            # Raises for modes Mapbox doesn't support
+            mode_url = f"{self.routing_url}/{get_mapbox_specific_mode(mode)}"
         params = {
-            "depart_at": departure_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "access_token": self.api_key,
-            "exclude": "ferry",  # by default I think it includes ferries, but for our API we use just driving, without ferries
+            **self._base_params,
+            "depart_at": _format_departure_time(departure_time),
         }
         try:
-            async with (
-                aiohttp.ClientSession(timeout=self.default_timeout) as session,
-                session.get(
-                    f"{self.routing_url}/{transport_mode}/{route}", params=params
-                ) as response,
-            ):
-                data = await response.json()
-                if response.status == 200:
-                    route = data["routes"][0]
-                    duration = route["duration"]
-                    if not duration:
-                        raise MapboxApiError(
-                            "No route found between origin and destination."
+            status, response_body = await self._fetch(
+                "GET", f"{mode_url}/{route}", params=params
+            )
+            if status == 200:
+                data = orjson.loads(response_body)
+                route = data["routes"][0]
+                duration = route["duration"]
+                if not duration:
+                    raise MapboxApiError(
+                        "No route found between origin and destination."
+                    )
+
+                distance = route.get("distance")
+
+                snapped = None
+                waypoints = data.get("waypoints", [])
+                if len(waypoints) >= 2:
+                    origin_wp = waypoints[0].get("location", [])
+                    dest_wp = waypoints[-1].get("location", [])
+                    if len(origin_wp) >= 2 and len(dest_wp) >= 2:
+                        snapped = SnappedCoordinates(
+                            origin_lat=origin_wp[1],
+                            origin_lng=origin_wp[0],
+                            destination_lat=dest_wp[1],
+                            destination_lng=dest_wp[0],
                         )
 
-                    distance = route.get("distance")
-
-                    snapped = None
-                    waypoints = data.get("waypoints", [])
-                    if len(waypoints) >= 2:
-                        origin_wp = waypoints[0].get("location", [])
-                        dest_wp = waypoints[-1].get("location", [])
-                        if len(origin_wp) >= 2 and len(dest_wp) >= 2:
-                            snapped = SnappedCoordinates(
-                                origin_lat=origin_wp[1],
-                                origin_lng=origin_wp[0],
-                                destination_lat=dest_wp[1],
-                                destination_lng=dest_wp[0],
-                            )
-
-                    return RequestResult(
-                        travel_time=int(duration),
-                        distance=int(distance) if distance else None,
-                        snapped_coords=snapped,
-                    )
-                else:
-                    error_message = data.get("detailedError", "")
-                    logger.error(
-                        f"Error in Mapbox API response: {response.status} - {error_message}"
-                    )
-                    return RequestResult(None)
+                return RequestResult(
+                    travel_time=int(duration),
+                    distance=int(distance) if distance else None,
+                    snapped_coords=snapped,
+                )
+            else:
+                # Error bodies are only logged, and may not be JSON at all
+                logger.error(
+                    "Error in Mapbox API response: %s - %s",
+                    status,
+                    response_body.decode(errors="replace"),
+                )
+                return EMPTY_RESULT
         except Exception as e:
-            logger.error(f"Exception during requesting Mapbox API, {e}")
-            return RequestResult(None)
+            logger.error("Exception during requesting Mapbox API, %s", e)
+            return EMPTY_RESULT
+
+
+_MAPBOX_MODES = {Mode.DRIVING: "driving-traffic"}
 
 
 def get_mapbox_specific_mode(mode: Mode) -> str:
-    if mode == Mode.DRIVING:
-        return "driving-traffic"
-    elif mode == Mode.PUBLIC_TRANSPORT:
-        raise ValueError("Public transport is not supported for Mapbox requests")
-    else:
-        raise ValueError(f"Unsupported mode: `{mode.value}`")
+    try:
+        return _MAPBOX_MODES[mode]
+    except KeyError:
+        if mode == Mode.PUBLIC_TRANSPORT:
+            raise ValueError(
+                "Public transport is not supported for Mapbox requests"
+            ) from None
+        raise ValueError(f"Unsupported mode: `{mode.value}`") from None
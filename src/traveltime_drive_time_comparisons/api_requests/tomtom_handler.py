@@ -1,19 +1,23 @@
 import logging
 from datetime import datetime
 
-import aiohttp
+import orjson
 from traveltimepy.requests.common import Coordinates
 
 from traveltime_drive_time_comparisons.config import Mode
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    EMPTY_RESULT,
     BaseRequestHandler,
     RequestResult,
     SnappedCoordinates,
+    cached_time_formatter,
     create_async_limiter,
 )
 
 logger = logging.getLogger(__name__)
 
+_format_departure_time = cached_time_formatter(datetime.isoformat)
+
 
 class TomTomApiError(Exception):
     pass
@@ -23,8 +27,6 @@ class TomTomRequestHandler(BaseRequestHandler):
     DEFAULT_API_ENDPOINT = "https://api.tomtom.com"
     ROUTING_PATH = "/routing/1/calculateRoute/"
 
-    default_timeout = aiohttp.ClientTimeout(total=60)
-
     def __init__(self, api_key, max_rpm, api_endpoint):
         self.api_key = api_key
         self._rate_limiter = create_async_limiter(max_rpm)
@@ -41,62 +43,66 @@ class TomTomRequestHandler(BaseRequestHandler):
         route = f"{origin.lat},{origin.lng}:{destination.lat},{destination.lng}"
         params = {
             "key": self.api_key,
-            "departAt": departure_time.isoformat(),
+            "departAt": _format_departure_time(departure_time),
             "travelMode": get_tomtom_specific_mode(mode),
         }
         try:
-            async with (
-                aiohttp.ClientSession(timeout=self.default_timeout) as session,
-                session.get(
-                    f"{self.routing_url}{route}/json", params=params
-                ) as response,
-            ):
-                data = await response.json()
-                if response.status == 200:
-                    route = data["routes"][0]
-                    travel_time = route["summary"]["travelTimeInSeconds"]
-                    distance = route["summary"].get("lengthInMeters")
-
-                    if not travel_time:
-                        raise TomTomApiError(
-                            "No route found between origin and destination."
-                        )
+            status, response_body = await self._fetch(
+                "GET", f"{self.routing_url}{route}/json", params=params
+            )
+            if status == 200:
+                data = orjson.loads(response_body)
+                route = data["routes"][0]
+                travel_time = route["summary"]["travelTimeInSeconds"]
+                distance = route["summary"].get("lengthInMeters")
 
-                    snapped = None
-                    legs = route.get("legs", [])
-                    if legs:
-                        points = legs[0].get("points", [])
-                        if len(points) >= 2:
-                            first_point = points[0]
-                            last_point = points[-1]
-                            snapped = SnappedCoordinates(
-                                origin_lat=first_point.get("latitude"),
-                                origin_lng=first_point.get("longitude"),
-                                destination_lat=last_point.get("latitude"),
-                                destination_lng=last_point.get("longitude"),
-                            )
-
-                    return RequestResult(
-                        travel_time=travel_time,
-                        distance=distance,
-                        snapped_coords=snapped,
+                if not travel_time:
+                    raise TomTomApiError(
+                        "No route found between origin and destination."
                     )
-                else:
-                    error_message = data.get("detailedError", "")
-                    logger.error(
-                        f"Error in TomTom API response: {response.status} - {error_message}"
-                    )
-                    return RequestResult(None)
+
+                snapped = None
+                legs = route.get("legs", [])
+                if legs:
+                    points = legs[0].get("points", [])
+                    if len(points) >= 2:
+                        first_point = points[0]
+                        last_point = points[-1]
+                        snapped = SnappedCoordinates(
+                            origin_lat=first_point.get("latitude"),
+                            origin_lng=first_point.get("longitude"),
+                            destination_lat=last_point.get("latitude"),
+                            destination_lng=last_point.get("longitude"),
+                        )
+
+                return RequestResult(
+                    travel_time=travel_time,
+                    distance=distance,
+                    snapped_coords=snapped,
+                )
+            else:
+                # Error bodies are only logged, and may not be JSON at all
+                logger.error(
+                    "Error in TomTom API response: %s - %s",
+                    status,
+                    response_body.decode(errors="replace"),
+                )
+                return EMPTY_RESULT
         except Exception as e:
-            logger.error(f"Exception during requesting TomTom API, {e}")
-            return RequestResult(None)
+            logger.error("Exception during requesting TomTom API, %s", e)
+            return EMPTY_RESULT
+
+
+_TOMTOM_MODES = {
+    Mode.DRIVING: "car",
+    # TomTom doesn't have a general mode for transit / PT
+    # TODO: figure out how to compare PT modes across different providers
+    Mode.PUBLIC_TRANSPORT: "bus",
+}
 
 
 def get_tomtom_specific_mode(mode: Mode) -> str:
-    if mode == Mode.DRIVING:
-        return "car"
-    elif mode == Mode.PUBLIC_TRANSPORT:
-        return "bus"  # TomTom doesn't have a general mode for transit / PT
-        # TODO: figure out how to compare PT modes across different providers
-    else:
-        raise ValueError(f"Unsupported mode: `{mode.value}`")
+    try:
+        return _TOMTOM_MODES[mode]
+    except KeyError:
+        raise ValueError(f"Unsupported mode: `{mode.value}`") from None
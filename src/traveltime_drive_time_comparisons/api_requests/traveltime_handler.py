@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Union
+from typing import Dict, Optional, Union
 import logging
 
 from traveltimepy import AsyncClient
@@ -16,6 +16,7 @@ from traveltimepy.requests.transportation import Driving, PublicTransport
 
 from traveltime_drive_time_comparisons.config import Mode
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    EMPTY_RESULT,
     BaseRequestHandler,
     RequestResult,
     SnappedCoordinates,
@@ -34,11 +35,26 @@ class TravelTimeRequestHandler(BaseRequestHandler):
             "app_id": app_id,
             "api_key": api_key,
             "_user_agent": "Travel Time Comparison Tool",
+            # The client is reused across requests, so its own limiter must
+            # not be stricter than ours
+            "max_rpm": max_rpm,
         }
         if api_endpoint is not None:
             self.sdk_kwargs["_host"] = api_endpoint
 
         self._rate_limiter = create_async_limiter(max_rpm)
+        self._client: Optional[AsyncClient] = None
+
+    def _get_client(self) -> AsyncClient:
+        # Kept for the handler's lifetime so the SDK's connections are reused
+        if self._client is None:
+            self._client = AsyncClient(**self.sdk_kwargs)
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
 
     async def send_request(
         self,
@@ -51,9 +67,11 @@ class TravelTimeRequestHandler(BaseRequestHandler):
             Location(id=self.ORIGIN_ID, coords=origin),
             Location(id=self.DESTINATION_ID, coords=destination),
         ]
-        response = None
-        async with AsyncClient(**self.sdk_kwargs) as client:
-            try:
+        client = self._get_client()
+        try:
+            # The SDK sends the request itself, so it's throttled here rather
+            # than in _fetch
+            async with self._throttled():
                 response = await client.routes(
                     locations=locations,
                     departure_searches=[
@@ -72,16 +90,16 @@ class TravelTimeRequestHandler(BaseRequestHandler):
                     ],
                     arrival_searches=[],
                 )
-            except Exception as e:
-                logger.error(f"Exception during requesting TravelTime API, {e}")
-                return RequestResult(None)
+        except Exception as e:
+            logger.error("Exception during requesting TravelTime API, %s", e)
+            return EMPTY_RESULT
 
         if (
             not response
             or not response.results[0].locations
             or not response.results[0].locations[0].properties
         ):
-            return RequestResult(None)
+            return EMPTY_RESULT
 
         properties = response.results[0].locations[0].properties[0]
 
@@ -89,22 +107,26 @@ class TravelTimeRequestHandler(BaseRequestHandler):
         distance = None
         route = properties.route
         if route and route.parts:
-            all_coords = []
+            # Only the route's endpoints are needed, so track them instead of
+            # concatenating every coordinate. Distance is summed in the same pass.
+            first_coord = last_coord = None
+            coords_count = 0
+            distance = 0
             for part in route.parts:
                 if part.coords:
-                    all_coords.extend(part.coords)
-            if len(all_coords) >= 2:
-                first_coord = all_coords[0]
-                last_coord = all_coords[-1]
+                    if first_coord is None:
+                        first_coord = part.coords[0]
+                    last_coord = part.coords[-1]
+                    coords_count += len(part.coords)
+                if part.distance is not None:
+                    distance += part.distance
+            if coords_count >= 2 and first_coord and last_coord:
                 snapped = SnappedCoordinates(
                     origin_lat=first_coord.lat,
                     origin_lng=first_coord.lng,
                     destination_lat=last_coord.lat,
                     destination_lng=last_coord.lng,
                 )
-            distance = sum(
-                part.distance for part in route.parts if part.distance is not None
-            )
 
         return RequestResult(
             travel_time=properties.travel_time,
@@ -117,10 +139,15 @@ class RouteNotFoundError(Exception):
     pass
 
 
+# Built once and shared by every request, rather than validating a new model each time
+_TRAVELTIME_MODES: Dict[Mode, Union[Driving, PublicTransport]] = {
+    Mode.DRIVING: Driving(),
+    Mode.PUBLIC_TRANSPORT: PublicTransport(),
+}
+
+
 def get_traveltime_specific_mode(mode: Mode) -> Union[Driving, PublicTransport]:
-    if mode.value == Mode.DRIVING.value:
-        return Driving()
-    elif mode.value == Mode.PUBLIC_TRANSPORT.value:
-        return PublicTransport()
-    else:
-        raise ValueError(f"Unsupported mode `{mode.value}`")
+    try:
+        return _TRAVELTIME_MODES[mode]
+    except KeyError:
+        raise ValueError(f"Unsupported mode `{mode.value}`") from None
@@ -0,0 +1,94 @@
+import sqlite3
+from typing import Optional, Tuple
+
+import orjson
+
+from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    RequestResult,
+    SnappedCoordinates,
+)
+
+# (api, origin, destination, departure time in ISO format, mode)
+CacheKey = Tuple[str, str, str, str, str]
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS results (
+    api TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    destination TEXT NOT NULL,
+    departure_time TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    travel_time INTEGER NOT NULL,
+    distance INTEGER,
+    snapped_origin_lat REAL,
+    snapped_origin_lng REAL,
+    snapped_destination_lat REAL,
+    snapped_destination_lng REAL,
+    warnings TEXT NOT NULL,
+    PRIMARY KEY (api, origin, destination, departure_time, mode)
+)
+"""
+
+_SELECT = """
+SELECT travel_time, distance, snapped_origin_lat, snapped_origin_lng,
+       snapped_destination_lat, snapped_destination_lng, warnings
+FROM results
+WHERE api = ? AND origin = ? AND destination = ? AND departure_time = ? AND mode = ?
+"""
+
+_INSERT = "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+class RequestCache:
+    """Persists successful provider results so reruns don't repeat paid API calls."""
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path)
+        # WAL keeps the per-result commits cheap
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_CREATE_TABLE)
+        self._connection.commit()
+
+    def get(self, key: CacheKey) -> Optional[RequestResult]:
+        row = self._connection.execute(_SELECT, key).fetchone()
+        if row is None:
+            return None
+
+        travel_time, distance, *snapped_values, warnings = row
+        snapped = None
+        if any(value is not None for value in snapped_values):
+            # Columns are stored in SnappedCoordinates field order
+            snapped = SnappedCoordinates(*snapped_values)
+
+        return RequestResult(
+            travel_time=travel_time,
+            distance=distance,
+            snapped_coords=snapped,
+            warnings=orjson.loads(warnings),
+        )
+
+    def put(self, key: CacheKey, result: RequestResult) -> None:
+        # Failed requests are not stored, so they're retried on the next run
+        if result.travel_time is None:
+            return
+
+        snapped = result.snapped_coords
+        self._connection.execute(
+            _INSERT,
+            (
+                *key,
+                result.travel_time,
+                result.distance,
+                snapped.origin_lat if snapped else None,
+                snapped.origin_lng if snapped else None,
+                snapped.destination_lat if snapped else None,
+                snapped.destination_lng if snapped else None,
+                orjson.dumps(result.warnings).decode(),
+            ),
+        )
+        # Commit every result, so an interrupted run keeps what it has fetched
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,11 +1,17 @@
 import math
+import re
 import logging
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from traveltime_drive_time_comparisons.common import CaseCategory, Fields
+from traveltime_drive_time_comparisons.common import (
+    CASE_CATEGORIES,
+    CaseCategory,
+    Fields,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +39,145 @@ def parse_coordinates(coord_string: str) -> Tuple[float, float]:
     return float(parts[0]), float(parts[1])
 
 
+def haversine_distance_array(
+    lat1: np.ndarray,
+    lng1: np.ndarray,
+    lat2: np.ndarray,
+    lng2: np.ndarray,
+    cos_lat1: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Element-wise `haversine_distance` over coordinate arrays; NaN inputs give NaN.
+
+    `cos_lat1` may be passed in when the same first points are compared against
+    several arrays of second points.
+    """
+    if cos_lat1 is None:
+        cos_lat1 = np.cos(np.radians(lat1))
+    delta_lat = np.radians(lat2 - lat1)
+    delta_lng = np.radians(lng2 - lng1)
+
+    a = (
+        np.sin(delta_lat / 2) ** 2
+        + cos_lat1 * np.cos(np.radians(lat2)) * np.sin(delta_lng / 2) ** 2
+    )
+    return EARTH_RADIUS_METERS * 2 * np.arcsin(np.sqrt(a))
+
+
+def _farther_than(
+    lat1: np.ndarray,
+    lng1: np.ndarray,
+    cos_lat1: np.ndarray,
+    lat2: np.ndarray,
+    lng2: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """Whether each pair of points is more than `threshold` meters apart; NaN inputs give False."""
+    # Most snapped points sit well within the threshold. The equirectangular
+    # approximation is cheap and, away from the poles, accurate enough to rule those
+    # out with a wide margin, so the exact distance is only computed for the rest.
+    delta_lat = np.radians(lat2 - lat1)
+    delta_lng = np.radians(lng2 - lng1) * cos_lat1
+    approx_squared = (delta_lat**2 + delta_lng**2) * EARTH_RADIUS_METERS**2
+    candidates = np.flatnonzero(approx_squared > (threshold / 2) ** 2)
+
+    result = np.zeros(len(lat1), dtype=bool)
+    result[candidates] = (
+        haversine_distance_array(
+            lat1[candidates],
+            lng1[candidates],
+            lat2[candidates],
+            lng2[candidates],
+            cos_lat1[candidates],
+        )
+        > threshold
+    )
+    return result
+
+
+def parse_coordinates_column(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse a column of `lat,lng` strings, with NaN wherever a value is missing or invalid."""
+    # The same coordinates repeat across departure times and providers, so each
+    # distinct string is parsed once and the results are spread back out
+    codes, uniques = pd.factorize(values)
+    parts = pd.Series(uniques).astype("string").str.split(",", expand=True)
+    if parts.shape[1] < 2:
+        missing = np.full(len(values), np.nan)
+        return missing, missing
+
+    lat, lng = (
+        pd.to_numeric(parts[i].str.strip(), errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        for i in (0, 1)
+    )
+    # A value is only usable if both halves parse
+    invalid = np.isnan(lat) | np.isnan(lng)
+    lat[invalid] = np.nan
+    lng[invalid] = np.nan
+    # Missing values are coded -1, which picks up the trailing NaN
+    return np.append(lat, np.nan)[codes], np.append(lng, np.nan)[codes]
+
+
+# Category codes indexed by bad origin (bit 0) and bad destination (bit 1)
+_SNAP_CATEGORY_CODES = np.array(
+    [
+        CASE_CATEGORIES.index(CaseCategory.CLEAN),
+        CASE_CATEGORIES.index(CaseCategory.BAD_SNAP_ORIGIN),
+        CASE_CATEGORIES.index(CaseCategory.BAD_SNAP_DESTINATION),
+        CASE_CATEGORIES.index(CaseCategory.BAD_SNAP_BOTH),
+    ],
+    dtype=np.int8,
+)
+
+
+def _bad_snapping_codes(
+    df: DataFrame, provider_names: List[str], threshold: float
+) -> np.ndarray:
+    bad_origin = np.zeros(len(df), dtype=bool)
+    bad_destination = np.zeros(len(df), dtype=bool)
+
+    # Missing or unparsable coordinates are NaN, which never count as too far,
+    # so those comparisons are skipped
+    origin_lat, origin_lng = parse_coordinates_column(df[Fields.ORIGIN])
+    dest_lat, dest_lng = parse_coordinates_column(df[Fields.DESTINATION])
+    # Shared by every provider's comparison against the requested points
+    cos_origin_lat = np.cos(np.radians(origin_lat))
+    cos_dest_lat = np.cos(np.radians(dest_lat))
+
+    for provider in provider_names:
+        snapped_origin_col = Fields.SNAPPED_ORIGIN.get(provider)
+        snapped_dest_col = Fields.SNAPPED_DESTINATION.get(provider)
+
+        if snapped_origin_col and snapped_origin_col in df.columns:
+            snap_lat, snap_lng = parse_coordinates_column(df[snapped_origin_col])
+            bad_origin |= _farther_than(
+                origin_lat, origin_lng, cos_origin_lat, snap_lat, snap_lng, threshold
+            )
+
+        if snapped_dest_col and snapped_dest_col in df.columns:
+            snap_lat, snap_lng = parse_coordinates_column(df[snapped_dest_col])
+            bad_destination |= _farther_than(
+                dest_lat, dest_lng, cos_dest_lat, snap_lat, snap_lng, threshold
+            )
+
+    # Rows whose requested origin or destination can't be parsed aren't judged at all
+    requested_valid = ~(np.isnan(origin_lat) | np.isnan(dest_lat))
+    bad_origin &= requested_valid
+    bad_destination &= requested_valid
+
+    # The two flags form a 2-bit index into the category codes; take() returns a
+    # fresh array, so callers are free to modify it
+    snap_index = bad_origin.view(np.uint8) | (bad_destination.view(np.uint8) << 1)
+    return _SNAP_CATEGORY_CODES.take(snap_index)
+
+
+def _as_case_categories(codes: np.ndarray) -> "pd.Categorical[str]":
+    # Stored as a categorical, so later filters compare small integer codes
+    # rather than strings
+    return pd.Categorical.from_codes(codes, categories=pd.Index(CASE_CATEGORIES))
+
+
 def detect_bad_snapping(
     df: DataFrame,
     provider_names: List[str],
@@ -50,58 +195,9 @@ def detect_bad_snapping(
     - 'bad_snap_destination': Destination snapped >threshold from requested
     - 'bad_snap_both': Both origin and destination have snapping issues
     """
-    df = df.copy()
-    categories = [CaseCategory.CLEAN] * len(df)
-
-    for i, (idx, row) in enumerate(df.iterrows()):
-        try:
-            origin_lat, origin_lng = parse_coordinates(row[Fields.ORIGIN])
-            dest_lat, dest_lng = parse_coordinates(row[Fields.DESTINATION])
-        except (ValueError, TypeError):
-            continue
-
-        bad_origin = False
-        bad_destination = False
-
-        for provider in provider_names:
-            snapped_origin_col = Fields.SNAPPED_ORIGIN.get(provider)
-            snapped_dest_col = Fields.SNAPPED_DESTINATION.get(provider)
-
-            if snapped_origin_col and snapped_origin_col in df.columns:
-                snapped_origin = row.get(snapped_origin_col)
-                if pd.notna(snapped_origin):
-                    try:
-                        snap_lat, snap_lng = parse_coordinates(str(snapped_origin))
-                        distance = haversine_distance(
-                            origin_lat, origin_lng, snap_lat, snap_lng
-                        )
-                        if distance > threshold:
-                            bad_origin = True
-                    except (ValueError, TypeError):
-                        pass
-
-            if snapped_dest_col and snapped_dest_col in df.columns:
-                snapped_dest = row.get(snapped_dest_col)
-                if pd.notna(snapped_dest):
-                    try:
-                        snap_lat, snap_lng = parse_coordinates(str(snapped_dest))
-                        distance = haversine_distance(
-                            dest_lat, dest_lng, snap_lat, snap_lng
-                        )
-                        if distance > threshold:
-                            bad_destination = True
-                    except (ValueError, TypeError):
-                        pass
-
-        if bad_origin and bad_destination:
-            categories[i] = CaseCategory.BAD_SNAP_BOTH
-        elif bad_origin:
-            categories[i] = CaseCategory.BAD_SNAP_ORIGIN
-        elif bad_destination:
-            categories[i] = CaseCategory.BAD_SNAP_DESTINATION
-
-    df[Fields.CASE_CATEGORY] = categories
-    return df
+    codes = _bad_snapping_codes(df, provider_names, threshold)
+    # assign shares the existing columns instead of copying the whole frame
+    return df.assign(**{Fields.CASE_CATEGORY: _as_case_categories(codes)})
 
 
 RESTRICTED_ROAD_KEYWORDS = [
@@ -109,25 +205,60 @@ RESTRICTED_ROAD_KEYWORDS = [
     "private",
 ]
 
+_RESTRICTED_ROAD_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in RESTRICTED_ROAD_KEYWORDS), re.IGNORECASE
+)
+
 
 def has_restricted_road_warning(warnings_str: Optional[str]) -> bool:
     if not warnings_str or pd.isna(warnings_str):
         return False
-    warnings_lower = warnings_str.lower()
-    return any(keyword in warnings_lower for keyword in RESTRICTED_ROAD_KEYWORDS)
+    # Same pattern as the column-wise scan, so both always agree
+    return _RESTRICTED_ROAD_PATTERN.search(warnings_str) is not None
 
 
-def detect_restricted_roads(df: DataFrame) -> DataFrame:
-    df = df.copy()
-    warnings_col = Fields.WARNINGS.get("google")
+def _warnings_columns(df: DataFrame) -> List[str]:
+    return [col for col in Fields.WARNINGS.values() if col in df.columns]
+
+
+def _restricted_road_mask(df: DataFrame) -> np.ndarray:
+    # A restricted road warning from any provider flags the row
+    mask = np.zeros(len(df), dtype=bool)
+    for warnings_col in _warnings_columns(df):
+        mask |= (
+            df[warnings_col]
+            .astype("string")
+            .str.contains(_RESTRICTED_ROAD_PATTERN, na=False)
+            .to_numpy(dtype=bool)
+        )
+    return mask
+
 
-    if warnings_col not in df.columns:
+def detect_restricted_roads(df: DataFrame) -> DataFrame:
+    if not _warnings_columns(df):
         return df
 
-    for i, (idx, row) in enumerate(df.iterrows()):
-        if row[Fields.CASE_CATEGORY] == CaseCategory.CLEAN:
-            warnings_str = row.get(warnings_col)
-            if has_restricted_road_warning(warnings_str):
-                df.at[idx, Fields.CASE_CATEGORY] = CaseCategory.RESTRICTED_ROAD
+    is_clean = (df[Fields.CASE_CATEGORY] == CaseCategory.CLEAN).to_numpy()
+    categories = df[Fields.CASE_CATEGORY].where(
+        ~(_restricted_road_mask(df) & is_clean), CaseCategory.RESTRICTED_ROAD
+    )
+
+    return df.assign(**{Fields.CASE_CATEGORY: categories})
 
-    return df
+
+def classify_rows(
+    df: DataFrame,
+    provider_names: List[str],
+    threshold: float = BAD_SNAP_THRESHOLD_METERS,
+) -> "pd.Categorical[str]":
+    """
+    Case category for every row, as `detect_bad_snapping` followed by
+    `detect_restricted_roads` would assign it, without building the
+    intermediate DataFrames.
+    """
+    codes = _bad_snapping_codes(df, provider_names, threshold)
+    restricted = _restricted_road_mask(df) & (
+        codes == CASE_CATEGORIES.index(CaseCategory.CLEAN)
+    )
+    codes[restricted] = CASE_CATEGORIES.index(CaseCategory.RESTRICTED_ROAD)
+    return _as_case_categories(codes)
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from contextlib import AsyncExitStack
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import pandas as pd
 import pytz
@@ -9,9 +10,11 @@ from pandas import DataFrame
 from pytz.tzinfo import BaseTzInfo
 from traveltimepy.requests.common import Coordinates
 
+from traveltime_drive_time_comparisons.cache import RequestCache
 from traveltime_drive_time_comparisons.common import (
     Fields,
     get_capitalized_provider_name,
+    travel_time_dtypes,
 )
 from traveltime_drive_time_comparisons.config import Mode
 from traveltime_drive_time_comparisons.api_requests.base_handler import (
@@ -22,44 +25,92 @@ from traveltime_drive_time_comparisons.api_requests.base_handler import (
 logger = logging.getLogger(__name__)
 
 
+class _ProviderColumns(NamedTuple):
+    travel_time: str
+    distance: str
+    snapped_origin: str
+    snapped_destination: str
+    warnings: Optional[str]
+
+
+# Output column names for each provider, resolved once rather than once per result
+_PROVIDER_COLUMNS = {
+    api: _ProviderColumns(
+        travel_time=Fields.TRAVEL_TIME[api],
+        distance=Fields.DISTANCE[api],
+        snapped_origin=Fields.SNAPPED_ORIGIN[api],
+        snapped_destination=Fields.SNAPPED_DESTINATION[api],
+        warnings=Fields.WARNINGS.get(api),
+    )
+    for api in Fields.TRAVEL_TIME
+}
+
+
 async def fetch_travel_time(
     origin: str,
     destination: str,
+    origin_coord: Coordinates,
+    destination_coord: Coordinates,
     api: str,
     departure_time: datetime,
+    departure_time_str: str,
     request_handler: BaseRequestHandler,
     mode: Mode,
+    cache: Optional[RequestCache] = None,
 ) -> Dict[str, str]:
-    origin_coord = parse_coordinates(origin)
-    destination_coord = parse_coordinates(destination)
+    cache_key = (api, origin, destination, departure_time.isoformat(), mode.value)
+    result = cache.get(cache_key) if cache else None
 
-    async with request_handler.rate_limiter:
+    if result is None:
+        # Handlers apply their own rate and concurrency limits to every attempt
         logger.debug(
-            f"Sending request to {api} for {origin_coord}, {destination_coord}, {departure_time}"
+            "Sending request to %s for %s, %s, %s",
+            api,
+            origin_coord,
+            destination_coord,
+            departure_time,
         )
         result = await request_handler.send_request(
             origin_coord, destination_coord, departure_time, mode
         )
         logger.debug(
-            f"Finished request to {api} for {origin_coord}, {destination_coord}, {departure_time}"
-        )
-        return wrap_result(
-            origin,
-            destination,
-            result.travel_time,
-            result.distance,
-            result.snapped_coords,
-            result.warnings,
-            departure_time,
+            "Finished request to %s for %s, %s, %s",
             api,
+            origin_coord,
+            destination_coord,
+            departure_time,
         )
 
+        if cache:
+            cache.put(cache_key, result)
+
+    return wrap_result(
+        origin,
+        destination,
+        result.travel_time,
+        result.distance,
+        result.snapped_coords,
+        result.warnings,
+        departure_time_str,
+        api,
+    )
+
 
 def parse_coordinates(coord_string: str) -> Coordinates:
     lat, lng = [c.strip() for c in coord_string.split(",")]
     return Coordinates(lat=float(lat), lng=float(lng))
 
 
+def _parse_coordinates_column(coord_strings: pd.Series) -> List[Coordinates]:
+    if coord_strings.empty:
+        return []
+    parts = coord_strings.str.split(",", expand=True)
+    if parts.shape[1] != 2 or parts.isna().any(axis=None):
+        raise ValueError(f"Coordinates in `{coord_strings.name}` must be `lat,lng`")
+    lat_lng = parts.astype(float)
+    return [Coordinates(lat=lat, lng=lng) for lat, lng in zip(lat_lng[0], lat_lng[1])]
+
+
 def wrap_result(
     origin: str,
     destination: str,
@@ -67,34 +118,34 @@ def wrap_result(
     distance: Optional[int],
     snapped_coords: Optional[SnappedCoordinates],
     warnings: List[str],
-    departure_time: datetime,
+    departure_time_str: str,
     api: str,
 ) -> Dict[str, Any]:
+    columns = _PROVIDER_COLUMNS[api]
     result: Dict[str, Any] = {
         Fields.ORIGIN: origin,
         Fields.DESTINATION: destination,
-        Fields.DEPARTURE_TIME: departure_time.strftime("%Y-%m-%d %H:%M:%S%z"),
-        Fields.TRAVEL_TIME[api]: travel_time,
-        Fields.DISTANCE[api]: distance,
+        Fields.DEPARTURE_TIME: departure_time_str,
+        columns.travel_time: travel_time,
+        columns.distance: distance,
     }
     if snapped_coords:
         if (
             snapped_coords.origin_lat is not None
             and snapped_coords.origin_lng is not None
         ):
-            result[Fields.SNAPPED_ORIGIN[api]] = (
+            result[columns.snapped_origin] = (
                 f"{snapped_coords.origin_lat},{snapped_coords.origin_lng}"
             )
         if (
             snapped_coords.destination_lat is not None
             and snapped_coords.destination_lng is not None
         ):
-            result[Fields.SNAPPED_DESTINATION[api]] = (
+            result[columns.snapped_destination] = (
                 f"{snapped_coords.destination_lat},{snapped_coords.destination_lng}"
             )
-    warnings_col = Fields.WARNINGS.get(api)
-    if warnings_col and warnings:
-        result[warnings_col] = "|".join(warnings)
+    if columns.warnings and warnings:
+        result[columns.warnings] = "|".join(warnings)
     return result
 
 
@@ -108,18 +159,38 @@ def generate_tasks(
     time_instants: List[datetime],
     request_handlers: Dict[str, BaseRequestHandler],
     mode: Mode,
+    cache: Optional[RequestCache] = None,
 ) -> list:
     tasks = []
-    for index, row in data.iterrows():
+    # Each origin/destination pair gets a single output row, so repeated input
+    # rows would only cost extra API calls
+    data = data.drop_duplicates(subset=[Fields.ORIGIN, Fields.DESTINATION])
+    # Only a handful of departure times are shared by every task, so format them once
+    departure_time_strs = {
+        time_instant: time_instant.strftime("%Y-%m-%d %H:%M:%S%z")
+        for time_instant in time_instants
+    }
+    # Parse each column once up front rather than twice per task
+    origin_coords = _parse_coordinates_column(data[Fields.ORIGIN])
+    destination_coords = _parse_coordinates_column(data[Fields.DESTINATION])
+    origins = data[Fields.ORIGIN].to_numpy()
+    destinations = data[Fields.DESTINATION].to_numpy()
+    for origin, destination, origin_coord, destination_coord in zip(
+        origins, destinations, origin_coords, destination_coords
+    ):
         for time_instant in time_instants:
             for api, request_handler in request_handlers.items():
                 task = fetch_travel_time(
-                    row[Fields.ORIGIN],
-                    row[Fields.DESTINATION],
+                    origin,
+                    destination,
+                    origin_coord,
+                    destination_coord,
                     api,
                     time_instant,
+                    departure_time_strs[time_instant],
                     request_handler,
                     mode=mode,
+                    cache=cache,
                 )
                 tasks.append(task)
     return tasks
@@ -131,38 +202,69 @@ async def collect_travel_times(
     request_handlers: Dict[str, BaseRequestHandler],
     provider_names: List[str],
 ) -> DataFrame:
-    timezone = pytz.timezone(args.time_zone_id)
-    time_instants = generate_time_instants(args.departure_times, args.date, timezone)
+    # The handlers and the cache are released however collection ends, including
+    # when the input fails to parse before any request is sent
+    async with AsyncExitStack() as resources:
+        for request_handler in request_handlers.values():
+            resources.push_async_callback(request_handler.close)
 
-    tasks = generate_tasks(data, time_instants, request_handlers, mode=Mode.DRIVING)
+        timezone = pytz.timezone(args.time_zone_id)
+        time_instants = generate_time_instants(
+            args.departure_times, args.date, timezone
+        )
 
-    capitalized_providers_str = ", ".join(
-        [get_capitalized_provider_name(provider) for provider in provider_names]
-    )
-    logger.info(f"Sending {len(tasks)} requests to {capitalized_providers_str} APIs")
+        cache = None
+        if args.cache_db:
+            cache = RequestCache(args.cache_db)
+            resources.callback(cache.close)
+        tasks = generate_tasks(
+            data,
+            time_instants,
+            request_handlers,
+            mode=Mode.DRIVING,
+            cache=cache,
+        )
 
-    results = await asyncio.gather(*tasks)
+        capitalized_providers_str = ", ".join(
+            [get_capitalized_provider_name(provider) for provider in provider_names]
+        )
+        logger.info(
+            f"Sending {len(tasks)} requests to {capitalized_providers_str} APIs"
+        )
+
+        results = await asyncio.gather(*tasks)
 
-    results_df = pd.DataFrame(results)
+    # Each task fills in one provider's columns, so merge them into a single row
+    # per origin/destination/departure time, keeping the input order
+    merged_rows: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+    for result in results:
+        key = (
+            result[Fields.ORIGIN],
+            result[Fields.DESTINATION],
+            result[Fields.DEPARTURE_TIME],
+        )
+        merged_rows.setdefault(key, {}).update(result)
+    results_df = pd.DataFrame(list(merged_rows.values()))
 
-    agg_dict = {Fields.TRAVEL_TIME[provider]: "first" for provider in provider_names}
+    columns = [Fields.ORIGIN, Fields.DESTINATION, Fields.DEPARTURE_TIME]
+    columns.extend(
+        _PROVIDER_COLUMNS[provider].travel_time for provider in provider_names
+    )
     for provider in provider_names:
-        snapped_origin_col = Fields.SNAPPED_ORIGIN[provider]
-        snapped_dest_col = Fields.SNAPPED_DESTINATION[provider]
-        distance_col = Fields.DISTANCE[provider]
-        warnings_col = Fields.WARNINGS.get(provider)
-        if snapped_origin_col in results_df.columns:
-            agg_dict[snapped_origin_col] = "first"
-        if snapped_dest_col in results_df.columns:
-            agg_dict[snapped_dest_col] = "first"
-        if distance_col in results_df.columns:
-            agg_dict[distance_col] = "first"
-        if warnings_col and warnings_col in results_df.columns:
-            agg_dict[warnings_col] = "first"
-
-    deduplicated = results_df.groupby(
-        [Fields.ORIGIN, Fields.DESTINATION, Fields.DEPARTURE_TIME], as_index=False
-    ).agg(agg_dict)
+        provider_columns = _PROVIDER_COLUMNS[provider]
+        columns.extend(
+            [
+                provider_columns.snapped_origin,
+                provider_columns.snapped_destination,
+                provider_columns.distance,
+            ]
+        )
+        if provider_columns.warnings:
+            columns.append(provider_columns.warnings)
+
+    deduplicated = results_df[
+        [col for col in columns if col in results_df.columns]
+    ].astype(travel_time_dtypes(provider_names))
     deduplicated.to_csv(args.output, index=False)
     return deduplicated
 
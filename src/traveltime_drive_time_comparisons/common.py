@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
 
 GOOGLE_API = "google"
 TOMTOM_API = "tomtom"
@@ -21,6 +24,16 @@ class CaseCategory:
     RESTRICTED_ROAD = "restricted_road"
 
 
+# Fixed category order for the case_category column's categorical dtype
+CASE_CATEGORIES = [
+    CaseCategory.CLEAN,
+    CaseCategory.BAD_SNAP_ORIGIN,
+    CaseCategory.BAD_SNAP_DESTINATION,
+    CaseCategory.BAD_SNAP_BOTH,
+    CaseCategory.RESTRICTED_ROAD,
+]
+
+
 @dataclass
 class Fields:
     ORIGIN = "origin"
@@ -60,16 +73,23 @@ class Fields:
     CASE_CATEGORY = "case_category"
 
 
+_CAPITALIZED_PROVIDER_NAMES = {
+    GOOGLE_API: "Google",
+    TOMTOM_API: "TomTom",
+    HERE_API: "HERE",
+    MAPBOX_API: "Mapbox",
+    TRAVELTIME_API: "TravelTime",
+}
+
+
 def get_capitalized_provider_name(provider: str) -> str:
-    if provider == "google":
-        return "Google"
-    elif provider == "tomtom":
-        return "TomTom"
-    elif provider == "here":
-        return "HERE"
-    elif provider == "mapbox":
-        return "Mapbox"
-    elif provider == "traveltime":
-        return "TravelTime"
-    else:
-        raise ValueError(f"Unsupported API provider: {provider}")
+    try:
+        return _CAPITALIZED_PROVIDER_NAMES[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported API provider: {provider}") from None
+
+
+def travel_time_dtypes(provider_names: List[str]) -> Dict[str, type]:
+    # Travel times are whole seconds, exact in float32 far beyond any route's
+    # duration, and float still leaves room for NaN where a request failed
+    return {Fields.TRAVEL_TIME[provider]: np.float32 for provider in provider_names}
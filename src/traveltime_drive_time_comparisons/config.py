@@ -1,10 +1,10 @@
 import argparse
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Union
 
+import orjson
 import pandas
-import json
 
 from traveltime_drive_time_comparisons.api_requests.traveltime_credentials import (
     Credentials,
@@ -27,8 +27,11 @@ pandas.set_option("display.max_columns", None)
 pandas.set_option("display.width", None)
 
 
+# Slots are declared by hand because `dataclass(slots=True)` needs Python 3.10
 @dataclass
 class Provider:
+    __slots__ = ("name", "max_rpm", "credentials", "api_endpoint")
+
     name: str
     max_rpm: int
     credentials: Credentials
@@ -37,6 +40,8 @@ class Provider:
 
 @dataclass
 class Providers:
+    __slots__ = ("base", "competitors")
+
     base: Provider
     competitors: List[Provider]
 
@@ -78,6 +83,14 @@ def parse_args():
         default="./config.json",
         help="Path to your config file. Default - ./config.json",
     )
+    parser.add_argument(
+        "--cache-db",
+        required=False,
+        help=(
+            "Path to an SQLite file caching provider results. "
+            "Requests already stored there are not sent again."
+        ),
+    )
     parser.add_argument(
         "--skip-data-gathering",
         action=argparse.BooleanOptionalAction,
@@ -99,8 +112,8 @@ def parse_args():
     return parser.parse_args()
 
 
-def parse_json_to_providers(json_data: str) -> Providers:
-    data = json.loads(json_data)
+def parse_json_to_providers(json_data: Union[str, bytes]) -> Providers:
+    data = orjson.loads(json_data)
 
     # Parse TravelTime (base provider)
     traveltime_data = data["traveltime"]
@@ -130,6 +143,7 @@ def parse_json_to_providers(json_data: str) -> Providers:
 
 
 def parse_config(file_path: str):
-    with open(file_path, "r") as file:  # letting it crash if this fails
+    # Read as bytes, which orjson parses directly without decoding to str first
+    with open(file_path, "rb") as file:  # letting it crash if this fails
         content = file.read()
         return parse_json_to_providers(content)
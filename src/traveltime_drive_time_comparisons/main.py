@@ -1,8 +1,8 @@
 import asyncio
 import logging
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from traveltime_drive_time_comparisons import collect
 from traveltime_drive_time_comparisons import config
@@ -15,16 +15,10 @@ from traveltime_drive_time_comparisons.common import (
     CaseCategory,
     Fields,
     RELATIVE_TIME_COLUMN,
+    travel_time_dtypes,
 )
 from traveltime_drive_time_comparisons.api_requests import factory
-from traveltime_drive_time_comparisons.plot import (
-    plot_accuracy_comparison,
-    plot_relative_time_comparison,
-)
-from traveltime_drive_time_comparisons.case_analysis import (
-    detect_bad_snapping,
-    detect_restricted_roads,
-)
+from traveltime_drive_time_comparisons.case_analysis import classify_rows
 
 logging.basicConfig(
     level=logging.INFO,
@@ -44,47 +38,57 @@ async def run(args=None):
     providers = parse_config(config_path)
     all_provider_names = providers.all_names()
 
-    csv = pd.read_csv(
-        args.input, usecols=[Fields.ORIGIN, Fields.DESTINATION]
-    ).drop_duplicates()
-
-    if len(csv) == 0:
-        logger.info("Provided input file is empty. Exiting.")
-        return
-
-    request_handlers = factory.initialize_request_handlers(providers)
     if args.skip_data_gathering:
-        travel_times_df = pd.read_csv(args.input)
+        # The input already holds the gathered travel times, so it's read only once
+        travel_times_df = pd.read_csv(
+            args.input, dtype=travel_time_dtypes(all_provider_names)
+        )
+        if len(travel_times_df) == 0:
+            logger.info("Provided input file is empty. Exiting.")
+            return
     else:
+        # Repeated origin/destination pairs are dropped when the requests are built
+        csv = pd.read_csv(args.input, usecols=[Fields.ORIGIN, Fields.DESTINATION])
+
+        if len(csv) == 0:
+            logger.info("Provided input file is empty. Exiting.")
+            return
+
+        request_handlers = factory.initialize_request_handlers(providers)
         travel_times_df = await collect.collect_travel_times(
             args, csv, request_handlers, all_provider_names
         )
 
-    travel_times_df = detect_bad_snapping(travel_times_df, all_provider_names)
-    travel_times_df = detect_restricted_roads(travel_times_df)
+    travel_times_df = travel_times_df.assign(
+        **{Fields.CASE_CATEGORY: classify_rows(travel_times_df, all_provider_names)}
+    )
 
     clean_travel_times_df = travel_times_df[
         travel_times_df[Fields.CASE_CATEGORY] == CaseCategory.CLEAN
     ]
 
-    filtered_travel_times_df = clean_travel_times_df.loc[
-        clean_travel_times_df[
-            [Fields.TRAVEL_TIME[provider] for provider in all_provider_names]
-        ]
-        .notna()
-        .all(axis=1),
-        :,
-    ]
+    # AND the per-provider presence masks directly, without building a boolean frame
+    has_all_travel_times = np.ones(len(clean_travel_times_df), dtype=bool)
+    for provider in all_provider_names:
+        has_all_travel_times &= (
+            clean_travel_times_df[Fields.TRAVEL_TIME[provider]].notna().to_numpy()
+        )
+    filtered_travel_times_df = clean_travel_times_df.loc[has_all_travel_times]
 
     all_rows = len(travel_times_df)
     clean_rows = len(clean_travel_times_df)
     filtered_rows = len(filtered_travel_times_df)
-    bad_snap_rows = (
-        travel_times_df[Fields.CASE_CATEGORY].str.startswith("bad_snap").sum()
+    # One pass over the categories instead of a scan per count
+    category_counts = travel_times_df[Fields.CASE_CATEGORY].value_counts()
+    bad_snap_rows = sum(
+        category_counts.get(category, 0)
+        for category in (
+            CaseCategory.BAD_SNAP_ORIGIN,
+            CaseCategory.BAD_SNAP_DESTINATION,
+            CaseCategory.BAD_SNAP_BOTH,
+        )
     )
-    restricted_road_rows = (
-        travel_times_df[Fields.CASE_CATEGORY] == CaseCategory.RESTRICTED_ROAD
-    ).sum()
+    restricted_road_rows = category_counts.get(CaseCategory.RESTRICTED_ROAD, 0)
     missing_data_rows = clean_rows - filtered_rows
 
     if bad_snap_rows > 0:
@@ -121,6 +125,15 @@ async def run(args=None):
         run_analysis(travel_times_df, args.output, 0.90, providers, args.debug)
 
         if not args.skip_plotting:
+            # pyplot is slow to import and probes for GUI backends, so runs
+            # that skip plotting never load it
+            import matplotlib.pyplot as plt
+
+            from traveltime_drive_time_comparisons.plot import (
+                plot_accuracy_comparison,
+                plot_relative_time_comparison,
+            )
+
             if not accuracy_df.empty:
                 plot_accuracy_comparison(accuracy_df, "Accuracy Score (Google = 100)")
                 if args.debug:
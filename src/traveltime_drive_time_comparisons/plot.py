@@ -21,7 +21,7 @@ def get_bar_colors(providers):
 def plot_accuracy_comparison(
     accuracy_df: pd.DataFrame, title: str = "Provider Accuracy Comparison"
 ):
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
     colors = get_bar_colors(accuracy_df[PROVIDER_COLUMN])
 
     bars = ax.bar(
@@ -37,16 +37,7 @@ def plot_accuracy_comparison(
     ax.set_xlabel(PROVIDER_COLUMN, fontsize=12)
     ax.set_ylabel(ACCURACY_SCORE_COLUMN, fontsize=12)
 
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 1,  # Increased padding for better visibility
-            f"{height:.1f}%",
-            ha="center",
-            va="bottom",
-            fontsize=10,
-        )
+    ax.bar_label(bars, fmt="%.1f%%", padding=3, fontsize=10)
 
     plt.xticks(rotation=45, ha="right")
 
@@ -56,14 +47,13 @@ def plot_accuracy_comparison(
     max_val = max(accuracy_df[ACCURACY_SCORE_COLUMN])
     ax.set_ylim(0, max_val + 5)
 
-    plt.tight_layout()
     return fig
 
 
 def plot_relative_time_comparison(
     accuracy_df: pd.DataFrame, title: str = "Provider Relative Time Comparison"
 ):
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), layout="constrained")
     colors = get_bar_colors(accuracy_df[PROVIDER_COLUMN])
 
     bars = ax.bar(
@@ -79,16 +69,7 @@ def plot_relative_time_comparison(
     ax.set_xlabel(PROVIDER_COLUMN, fontsize=12)
     ax.set_ylabel(f"{RELATIVE_TIME_COLUMN}", fontsize=12)
 
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width() / 2.0,
-            height + 2,  # Increased padding for better visibility
-            f"{height:.1f}%",
-            ha="center",
-            va="bottom",
-            fontsize=10,
-        )
+    ax.bar_label(bars, fmt="%.1f%%", padding=3, fontsize=10)
 
     plt.xticks(rotation=45, ha="right")
 
@@ -111,5 +92,4 @@ def plot_relative_time_comparison(
 
     ax.set_ylim(y_min, y_max)
 
-    plt.tight_layout()
     return fig
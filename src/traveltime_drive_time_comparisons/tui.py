@@ -112,6 +112,12 @@ def build_args(debug: bool = False) -> argparse.Namespace:
     )
     accuracy_output = ao if ao else None
     config_file = questionary.path("Config file:", default="./config.json").unsafe_ask()
+    cd = (
+        questionary.text("Route cache SQLite file (empty to skip):")
+        .unsafe_ask()
+        .strip()
+    )
+    cache_db = cd if cd else None
     date_str = questionary.text(
         "Date (YYYY-MM-DD):",
         default=next_wednesday(),
@@ -152,6 +158,7 @@ def build_args(debug: bool = False) -> argparse.Namespace:
         skip_data_gathering=skip_data_gathering,
         skip_plotting=skip_plotting,
         accuracy_output=accuracy_output,
+        cache_db=cache_db,
         debug=debug or None,
     )
 
@@ -172,6 +179,8 @@ def build_args(debug: bool = False) -> argparse.Namespace:
         table.add_row("Skip plotting", "Yes")
     if args.accuracy_output:
         table.add_row("Accuracy output", args.accuracy_output)
+    if args.cache_db:
+        table.add_row("Route cache", args.cache_db)
     if args.debug:
         table.add_row("Debug mode", "Yes")
 
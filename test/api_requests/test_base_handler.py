@@ -0,0 +1,159 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from traveltime_drive_time_comparisons.api_requests import base_handler
+from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    BaseRequestHandler,
+    create_async_limiter,
+)
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.acquisitions = 0
+        self.held = 0
+
+    async def __aenter__(self):
+        self.acquisitions += 1
+        self.held += 1
+
+    async def __aexit__(self, *exc_info):
+        self.held -= 1
+
+
+class StubRequestHandler(BaseRequestHandler):
+    def __init__(self):
+        self._rate_limiter = CountingLimiter()
+
+    async def send_request(self, origin, destination, departure_time, mode):
+        raise NotImplementedError
+
+
+@pytest.mark.parametrize(
+    "max_rpm, expected_max_rate, expected_time_period",
+    [
+        (60, 1, 1),
+        (600, 10, 1),
+        (30, 1, 2),
+        (1, 1, 60),
+    ],
+)
+def test_create_async_limiter_converts_rpm_to_rate(
+    max_rpm, expected_max_rate, expected_time_period
+):
+    limiter = create_async_limiter(max_rpm)
+
+    assert limiter.max_rate == pytest.approx(expected_max_rate)
+    assert limiter.time_period == pytest.approx(expected_time_period)
+
+
+def test_create_async_limiter_lets_concurrent_callers_through_without_serializing():
+    limiter = create_async_limiter(600)
+
+    async def acquire_burst():
+        # A full second's worth of capacity must be granted at once, not one
+        # caller at a time behind a sleeping lock holder
+        await asyncio.wait_for(
+            asyncio.gather(*(limiter.acquire() for _ in range(10))), timeout=0.5
+        )
+
+    asyncio.run(acquire_burst())
+
+
+async def fetch_from_server(statuses, handler=None):
+    # Serves the given statuses in turn and records how many requests arrived.
+    # Returns the final status, the number of requests and rate limiter acquisitions.
+    calls = []
+
+    async def handle(request):
+        status = statuses[min(len(calls), len(statuses) - 1)]
+        calls.append(status)
+        return web.Response(status=status, body=b"{}")
+
+    app = web.Application()
+    app.router.add_get("/", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    handler = handler or StubRequestHandler()
+    try:
+        status, _ = await handler._fetch("GET", f"http://127.0.0.1:{port}/")
+    finally:
+        await handler.close()
+        await runner.cleanup()
+    return status, len(calls), handler.rate_limiter.acquisitions
+
+
+def test_fetch_retries_server_errors(monkeypatch):
+    monkeypatch.setattr(base_handler, "RETRY_BACKOFF_SECONDS", 0)
+
+    assert asyncio.run(fetch_from_server([503, 200])) == (200, 2, 2)
+
+
+def test_fetch_returns_last_server_error_once_attempts_run_out(monkeypatch):
+    monkeypatch.setattr(base_handler, "RETRY_BACKOFF_SECONDS", 0)
+
+    max_attempts = base_handler.MAX_ATTEMPTS
+    assert asyncio.run(fetch_from_server([503])) == (503, max_attempts, max_attempts)
+
+
+def test_fetch_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(base_handler, "RETRY_BACKOFF_SECONDS", 0)
+
+    assert asyncio.run(fetch_from_server([400, 200])) == (400, 1, 1)
+
+
+def test_fetch_backs_off_without_holding_rate_limit_or_concurrency_slots(
+    monkeypatch,
+):
+    monkeypatch.setattr(base_handler, "RETRY_BACKOFF_SECONDS", 0.001)
+    # A single slot, so the semaphore reads as locked whenever a request holds it
+    monkeypatch.setattr(base_handler, "MAX_CONCURRENT_REQUESTS_PER_PROVIDER", 1)
+    handler = StubRequestHandler()
+    held_during_backoff = []
+    sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        if delay > 0:
+            semaphore = handler._concurrency_limit
+            held_during_backoff.append(
+                (
+                    handler.rate_limiter.held,
+                    semaphore is not None and semaphore.locked(),
+                )
+            )
+        await sleep(delay, *args, **kwargs)
+
+    monkeypatch.setattr(base_handler.asyncio, "sleep", recording_sleep)
+
+    assert asyncio.run(fetch_from_server([503, 503, 200], handler)) == (200, 3, 3)
+    assert held_during_backoff == [(0, False), (0, False)]
+
+
+def test_get_session_reuses_open_session():
+    async def get_sessions():
+        handler = StubRequestHandler()
+        try:
+            return handler._get_session() is handler._get_session()
+        finally:
+            await handler.close()
+
+    assert asyncio.run(get_sessions())
+
+
+def test_get_session_replaces_closed_session():
+    async def get_sessions():
+        handler = StubRequestHandler()
+        session = handler._get_session()
+        await session.close()
+        try:
+            return handler._get_session() is not session
+        finally:
+            await handler.close()
+
+    assert asyncio.run(get_sessions())
@@ -10,12 +10,12 @@ from traveltime_drive_time_comparisons.api_requests.google_handler import (
 
 def test_get_google_specific_mode_for_driving():
     result = get_google_travel_mode(Mode.DRIVING)
-    assert result == "driving"
+    assert result == "DRIVE"
 
 
 def test_get_google_specific_mode_for_public_transport():
     result = get_google_travel_mode(Mode.PUBLIC_TRANSPORT)
-    assert result == "transit"
+    assert result == "TRANSIT"
 
 
 def test_get_google_specific_mode_for_unsupported_mode():
@@ -0,0 +1,26 @@
+from enum import Enum
+
+import pytest
+
+from traveltime_drive_time_comparisons.config import Mode
+from traveltime_drive_time_comparisons.api_requests.here_handler import (
+    get_here_specific_mode,
+)
+
+
+def test_get_here_specific_mode_for_driving():
+    result = get_here_specific_mode(Mode.DRIVING)
+    assert result == "car"
+
+
+def test_get_here_specific_mode_for_public_transport():
+    result = get_here_specific_mode(Mode.PUBLIC_TRANSPORT)
+    assert result == "bus"
+
+
+def test_get_here_specific_mode_for_unsupported_mode():
+    class MockMode(Enum):
+        WALKING = "WALKING"
+
+    with pytest.raises(ValueError, match=r"Unsupported mode: `WALKING`"):
+        get_here_specific_mode(MockMode.WALKING)
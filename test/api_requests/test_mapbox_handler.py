@@ -0,0 +1,26 @@
+from enum import Enum
+
+import pytest
+
+from traveltime_drive_time_comparisons.config import Mode
+from traveltime_drive_time_comparisons.api_requests.mapbox_handler import (
+    get_mapbox_specific_mode,
+)
+
+
+def test_get_mapbox_specific_mode_for_driving():
+    result = get_mapbox_specific_mode(Mode.DRIVING)
+    assert result == "driving-traffic"
+
+
+def test_get_mapbox_specific_mode_for_public_transport():
+    with pytest.raises(ValueError, match=r"Public transport is not supported"):
+        get_mapbox_specific_mode(Mode.PUBLIC_TRANSPORT)
+
+
+def test_get_mapbox_specific_mode_for_unsupported_mode():
+    class MockMode(Enum):
+        WALKING = "WALKING"
+
+    with pytest.raises(ValueError, match=r"Unsupported mode: `WALKING`"):
+        get_mapbox_specific_mode(MockMode.WALKING)
@@ -1,3 +1,4 @@
+import logging
 import pandas as pd
 from traveltime_drive_time_comparisons.analysis import (
     QuantileErrorResult,
@@ -5,6 +6,7 @@ from traveltime_drive_time_comparisons.analysis import (
     calculate_accuracies,
     calculate_differences,
     calculate_quantiles,
+    log_results,
     relative_error,
 )
 from traveltime_drive_time_comparisons.common import (
@@ -130,6 +132,34 @@ def test_calculate_quantiles_for_unsorted_list():
     ) == QuantileErrorResult(40, 20)
 
 
+def test_calculate_quantiles_skips_missing_values():
+    with_missing_data = {
+        ABSOLUTE_ERROR_GOOGLE: [40, None, 10, 30, None],
+        RELATIVE_ERROR_GOOGLE: [20.0, float("nan"), 5.0, 15.0, float("nan")],
+    }
+    with_missing_df = pd.DataFrame(with_missing_data)
+    assert calculate_quantiles(
+        with_missing_df, 0.5, TRAVELTIME_API, GOOGLE_API
+    ) == QuantileErrorResult(30, 15)
+
+    all_missing_df = pd.DataFrame(
+        {ABSOLUTE_ERROR_GOOGLE: [float("nan")], RELATIVE_ERROR_GOOGLE: [float("nan")]}
+    )
+    assert calculate_quantiles(
+        all_missing_df, 0.5, TRAVELTIME_API, GOOGLE_API
+    ) == QuantileErrorResult(0, 0)
+
+
+def test_log_results_reports_calculated_quantile(caplog):
+    with caplog.at_level(logging.INFO):
+        log_results(odd_df, 0.75, PROVIDERS.base, PROVIDERS)
+
+    assert "Mean relative error compared to Google API: 15.00%" in caplog.text
+    assert "75% of TravelTime results differ from Google API by less than 20%" in (
+        caplog.text
+    )
+
+
 def test_calculate_accuracies():
     data = pd.DataFrame(
         {
@@ -146,6 +176,22 @@ def test_calculate_accuracies():
     assert list(result["Relative Time"].round()) == [100.0, 103.0, 97.0]
 
 
+def test_calculate_accuracies_with_nullable_integer_columns():
+    data = pd.DataFrame(
+        {
+            Fields.TRAVEL_TIME[GOOGLE_API]: [100, 200, 300, 400],
+            Fields.TRAVEL_TIME[TOMTOM_API]: [110, 190, 310, None],
+            Fields.TRAVEL_TIME[HERE_API]: [90, 210, 290, None],
+        }
+    ).astype("Int32")
+
+    result = calculate_accuracies(data, Fields.TRAVEL_TIME)
+
+    # Missing values are skipped, the same as NaN in float columns
+    assert list(result["Accuracy Score"].round()) == [100.0, 94.0, 94.0]
+    assert list(result["Relative Time"].round()) == [100.0, 103.0, 97.0]
+
+
 def test_format_results_for_csv_handles_nan_in_relative_errors():
     """Test that format_results_for_csv can handle NaN values from division by zero"""
     from traveltime_drive_time_comparisons.analysis import format_results_for_csv
@@ -0,0 +1,64 @@
+from traveltime_drive_time_comparisons.cache import RequestCache
+from traveltime_drive_time_comparisons.api_requests.base_handler import (
+    EMPTY_RESULT,
+    RequestResult,
+    SnappedCoordinates,
+)
+
+KEY = ("google", "51.5,-0.1", "51.6,-0.2", "2025-01-01T09:00:00+00:00", "driving")
+
+
+def test_cache_returns_none_on_miss(tmp_path):
+    cache = RequestCache(str(tmp_path / "cache.db"))
+
+    assert cache.get(KEY) is None
+
+
+def test_cache_round_trips_full_result(tmp_path):
+    cache = RequestCache(str(tmp_path / "cache.db"))
+    result = RequestResult(
+        travel_time=600,
+        distance=5000,
+        snapped_coords=SnappedCoordinates(51.5001, -0.1001, 51.6001, -0.2001),
+        warnings=["This route has restricted usage or private roads."],
+    )
+
+    cache.put(KEY, result)
+
+    assert cache.get(KEY) == result
+
+
+def test_cache_round_trips_result_without_snapping(tmp_path):
+    cache = RequestCache(str(tmp_path / "cache.db"))
+    result = RequestResult(travel_time=600)
+
+    cache.put(KEY, result)
+
+    assert cache.get(KEY) == result
+
+
+def test_cache_does_not_store_failed_requests(tmp_path):
+    cache = RequestCache(str(tmp_path / "cache.db"))
+
+    cache.put(KEY, EMPTY_RESULT)
+
+    assert cache.get(KEY) is None
+
+
+def test_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = RequestCache(path)
+    cache.put(KEY, RequestResult(travel_time=600, distance=5000))
+    cache.close()
+
+    assert RequestCache(path).get(KEY) == RequestResult(travel_time=600, distance=5000)
+
+
+def test_cache_keys_include_every_field(tmp_path):
+    cache = RequestCache(str(tmp_path / "cache.db"))
+    cache.put(KEY, RequestResult(travel_time=600))
+
+    for index in range(len(KEY)):
+        other_key = list(KEY)
+        other_key[index] = "other"
+        assert cache.get(tuple(other_key)) is None
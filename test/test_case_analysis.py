@@ -1,13 +1,18 @@
+import numpy as np
 import pandas as pd
 import pytest
 from traveltime_drive_time_comparisons.case_analysis import (
+    classify_rows,
     detect_bad_snapping,
     detect_restricted_roads,
     has_restricted_road_warning,
     haversine_distance,
+    haversine_distance_array,
     parse_coordinates,
+    parse_coordinates_column,
 )
 from traveltime_drive_time_comparisons.common import (
+    CASE_CATEGORIES,
     CaseCategory,
     Fields,
     GOOGLE_API,
@@ -40,6 +45,30 @@ class TestHaversineDistance:
         assert 20_000_000 < distance < 20_050_000
 
 
+class TestHaversineDistanceArray:
+    def test_matches_scalar_distance(self):
+        lat1 = np.array([51.5074, 51.5074, 0.0])
+        lng1 = np.array([-0.1278, -0.1278, 0.0])
+        lat2 = np.array([48.8566, 51.5083, 0.0])
+        lng2 = np.array([2.3522, -0.1278, 180.0])
+
+        distances = haversine_distance_array(lat1, lng1, lat2, lng2)
+
+        expected = [
+            haversine_distance(*points) for points in zip(lat1, lng1, lat2, lng2)
+        ]
+        assert distances == pytest.approx(expected)
+
+    def test_nan_coordinates_give_nan(self):
+        distances = haversine_distance_array(
+            np.array([np.nan, 51.5074]),
+            np.array([-0.1278, -0.1278]),
+            np.array([51.5074, 51.5074]),
+            np.array([-0.1278, np.nan]),
+        )
+        assert np.isnan(distances).all()
+
+
 class TestParseCoordinates:
     def test_standard_format(self):
         lat, lng = parse_coordinates("51.5074, -0.1278")
@@ -65,6 +94,28 @@ class TestParseCoordinates:
             parse_coordinates("abc, def")
 
 
+class TestParseCoordinatesColumn:
+    def test_parses_every_value(self):
+        lat, lng = parse_coordinates_column(
+            pd.Series(["51.5074, -0.1278", "48.8566,2.3522", "51.5074, -0.1278"])
+        )
+        assert lat.tolist() == [51.5074, 48.8566, 51.5074]
+        assert lng.tolist() == [-0.1278, 2.3522, -0.1278]
+
+    def test_missing_and_invalid_values_give_nan(self):
+        lat, lng = parse_coordinates_column(
+            pd.Series([None, "invalid", "abc, def", "51.5074, x", "51.5074, -0.1278"])
+        )
+        assert np.isnan(lat[:4]).all()
+        assert np.isnan(lng[:4]).all()
+        assert (lat[4], lng[4]) == (51.5074, -0.1278)
+
+    def test_column_without_any_comma_gives_nan(self):
+        lat, lng = parse_coordinates_column(pd.Series(["invalid", None]))
+        assert np.isnan(lat).all()
+        assert np.isnan(lng).all()
+
+
 class TestDetectBadSnapping:
     def test_clean_case_when_snap_within_threshold(self):
         # Snapped coordinates very close to original (within 200m threshold)
@@ -154,6 +205,19 @@ class TestDetectBadSnapping:
         result = detect_bad_snapping(df, [GOOGLE_API])
         assert result[Fields.CASE_CATEGORY].iloc[0] == CaseCategory.CLEAN
 
+    def test_snapped_column_read_as_all_nan_floats_treated_as_clean(self):
+        # A provider that never returned snapped points comes back from CSV as float NaN
+        df = pd.DataFrame(
+            {
+                Fields.ORIGIN: ["51.5074, -0.1278"],
+                Fields.DESTINATION: ["48.8566, 2.3522"],
+                Fields.SNAPPED_ORIGIN[GOOGLE_API]: [float("nan")],
+                Fields.SNAPPED_DESTINATION[GOOGLE_API]: [float("nan")],
+            }
+        )
+        result = detect_bad_snapping(df, [GOOGLE_API])
+        assert result[Fields.CASE_CATEGORY].iloc[0] == CaseCategory.CLEAN
+
     def test_invalid_origin_coordinates_skipped(self):
         df = pd.DataFrame(
             {
@@ -202,6 +266,17 @@ class TestDetectBadSnapping:
             CaseCategory.BAD_SNAP_DESTINATION,
         ]
 
+    def test_case_category_is_categorical_with_every_category(self):
+        df = pd.DataFrame(
+            {
+                Fields.ORIGIN: ["51.5074, -0.1278"],
+                Fields.DESTINATION: ["48.8566, 2.3522"],
+            }
+        )
+        result = detect_bad_snapping(df, [GOOGLE_API])
+        categories = result[Fields.CASE_CATEGORY].cat.categories
+        assert categories.tolist() == CASE_CATEGORIES
+
 
 class TestHasRestrictedRoadWarning:
     def test_returns_false_for_none(self):
@@ -314,3 +389,50 @@ class TestDetectRestrictedRoads:
             CaseCategory.CLEAN,
             CaseCategory.BAD_SNAP_ORIGIN,
         ]
+
+
+class TestClassifyRows:
+    def test_matches_detect_bad_snapping_then_detect_restricted_roads(self):
+        df = pd.DataFrame(
+            {
+                Fields.ORIGIN: ["51.5074, -0.1278", "52.0, 0.0", "53.0, 1.0"],
+                Fields.DESTINATION: ["48.8566, 2.3522", "49.0, 3.0", "50.0, 4.0"],
+                Fields.SNAPPED_ORIGIN[GOOGLE_API]: [
+                    "51.5074, -0.1278",
+                    "52.0, 0.0",
+                    "53.0030, 1.0",
+                ],
+                Fields.SNAPPED_DESTINATION[GOOGLE_API]: [
+                    "48.8566, 2.3522",
+                    "49.0, 3.0",
+                    "50.0, 4.0",
+                ],
+                Fields.WARNINGS[GOOGLE_API]: [
+                    "Route uses private roads",
+                    None,
+                    "Route uses restricted roads",
+                ],
+            }
+        )
+        expected = detect_restricted_roads(detect_bad_snapping(df, [GOOGLE_API]))
+
+        result = classify_rows(df, [GOOGLE_API])
+
+        assert result.tolist() == expected[Fields.CASE_CATEGORY].tolist()
+        assert result.tolist() == [
+            CaseCategory.RESTRICTED_ROAD,
+            CaseCategory.CLEAN,
+            CaseCategory.BAD_SNAP_ORIGIN,
+        ]
+
+    def test_without_warnings_column_only_snapping_is_classified(self):
+        df = pd.DataFrame(
+            {
+                Fields.ORIGIN: ["51.5074, -0.1278"],
+                Fields.DESTINATION: ["48.8566, 2.3522"],
+                Fields.SNAPPED_ORIGIN[GOOGLE_API]: ["51.5074, -0.1278"],
+                Fields.SNAPPED_DESTINATION[GOOGLE_API]: ["48.8600, 2.3522"],
+            }
+        )
+        result = classify_rows(df, [GOOGLE_API])
+        assert result.tolist() == [CaseCategory.BAD_SNAP_DESTINATION]
@@ -1,14 +1,34 @@
+import asyncio
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 
+import pandas as pd
 import pytz
 from traveltimepy.requests.common import Coordinates
 
+from traveltime_drive_time_comparisons.api_requests.base_handler import RequestResult
 from traveltime_drive_time_comparisons.collect import (
+    _parse_coordinates_column,
+    collect_travel_times,
+    generate_tasks,
     generate_time_instants,
     parse_coordinates,
     localize_datetime,
 )
+from traveltime_drive_time_comparisons.common import Fields
+from traveltime_drive_time_comparisons.config import Mode
+
+DEPARTURE_TIMES = [
+    datetime(2023, 9, 5, 12, 0, tzinfo=pytz.UTC),
+    datetime(2023, 9, 5, 13, 0, tzinfo=pytz.UTC),
+]
+
+
+def close_tasks(tasks):
+    # The generated coroutines are never awaited by these tests
+    for task in tasks:
+        task.close()
 
 
 def test_generate_time_instants_with_valid_times():
@@ -92,3 +112,109 @@ def test_localize_datetime_with_incorrect_format():
         wrong_time = "3:00 PM"
         timezone = pytz.timezone("US/Pacific")
         localize_datetime(date, wrong_time, timezone)
+
+
+def test_generate_tasks_skips_repeated_origin_destination_pairs():
+    data = pd.DataFrame(
+        {
+            Fields.ORIGIN: ["51.0,-0.1", "51.0,-0.1", "51.0,-0.1"],
+            Fields.DESTINATION: ["52.0,-0.2", "52.0,-0.2", "53.0,-0.3"],
+        }
+    )
+    handlers = {"google": object(), "tomtom": object()}
+
+    tasks = generate_tasks(data, DEPARTURE_TIMES, handlers, mode=Mode.DRIVING)
+    close_tasks(tasks)
+
+    # Two distinct pairs, each requested from both providers at both times
+    assert len(tasks) == 2 * len(DEPARTURE_TIMES) * len(handlers)
+
+
+class ClosingHandler:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_collect_travel_times_closes_handlers_when_input_is_invalid(tmp_path):
+    args = SimpleNamespace(
+        time_zone_id="UTC",
+        departure_times="12:00",
+        date="2023-09-05",
+        cache_db=str(tmp_path / "cache.db"),
+        output=str(tmp_path / "output.csv"),
+    )
+    data = pd.DataFrame(
+        {Fields.ORIGIN: ["51.0 -0.1"], Fields.DESTINATION: ["52.0,-0.2"]}
+    )
+    handlers = {"google": ClosingHandler(), "tomtom": ClosingHandler()}
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect_travel_times(args, data, handlers, list(handlers)))
+
+    assert all(handler.closed for handler in handlers.values())
+
+
+class DelayedHandler(ClosingHandler):
+    def __init__(self, travel_time, delays):
+        super().__init__()
+        self.travel_time = travel_time
+        self.delays = delays
+
+    async def send_request(self, origin, destination, departure_time, mode):
+        # Shorter delays for later rows make the requests finish back to front
+        await asyncio.sleep(self.delays[origin.lat])
+        return RequestResult(travel_time=self.travel_time)
+
+
+def test_collect_travel_times_merges_results_that_complete_out_of_order(tmp_path):
+    args = SimpleNamespace(
+        time_zone_id="UTC",
+        departure_times="12:00, 13:00",
+        date="2023-09-05",
+        cache_db=None,
+        output=str(tmp_path / "output.csv"),
+    )
+    data = pd.DataFrame(
+        {
+            Fields.ORIGIN: ["51.0,-0.1", "52.0,-0.1", "53.0,-0.1"],
+            Fields.DESTINATION: ["54.0,-0.2", "54.0,-0.2", "54.0,-0.2"],
+        }
+    )
+    handlers = {
+        "google": DelayedHandler(100, {51.0: 0.03, 52.0: 0.02, 53.0: 0.01}),
+        "tomtom": DelayedHandler(200, {51.0: 0.01, 52.0: 0.03, 53.0: 0.02}),
+    }
+
+    result = asyncio.run(collect_travel_times(args, data, handlers, list(handlers)))
+
+    assert list(result[Fields.ORIGIN]) == [
+        "51.0,-0.1",
+        "51.0,-0.1",
+        "52.0,-0.1",
+        "52.0,-0.1",
+        "53.0,-0.1",
+        "53.0,-0.1",
+    ]
+    assert result[Fields.DEPARTURE_TIME].str[11:16].tolist() == ["12:00", "13:00"] * 3
+    assert (result[Fields.TRAVEL_TIME["google"]] == 100).all()
+    assert (result[Fields.TRAVEL_TIME["tomtom"]] == 200).all()
+
+
+def test_parse_coordinates_column():
+    coords = pd.Series(["51.4614,-0.1120", " 51.5 , -0.2 "], name=Fields.ORIGIN)
+    assert _parse_coordinates_column(coords) == [
+        Coordinates(lat=51.4614, lng=-0.1120),
+        Coordinates(lat=51.5, lng=-0.2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "coord_string", ["51.4614 -0.1120", "51.4614,-0.1120,-122.4194"]
+)
+def test_parse_coordinates_column_rejects_malformed_coordinates(coord_string):
+    coords = pd.Series(["51.0,-0.1", coord_string], name=Fields.ORIGIN)
+    with pytest.raises(ValueError, match=f"`{Fields.ORIGIN}`"):
+        _parse_coordinates_column(coords)
@@ -1,6 +1,10 @@
+import copy
+import pickle
+
 from traveltime_drive_time_comparisons.config import (
     Provider,
     Providers,
+    parse_config,
     parse_json_to_providers,
 )
 from traveltime_drive_time_comparisons.api_requests.traveltime_credentials import (
@@ -115,3 +119,63 @@ def test_json_config_parse_empty_providers():
         ),
         competitors=[],
     )
+
+
+def test_config_file_parse(tmp_path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text("""
+        {
+          "traveltime": {
+            "app-id": "<your-app-id>",
+            "api-key": "<your-api-key>",
+            "max-rpm": "60"
+          },
+          "api-providers": [
+            {
+              "name": "google",
+              "enabled": true,
+              "api-key": "<your-api-key>",
+              "max-rpm": "60"
+            }
+          ]
+        }
+        """)
+
+    providers = parse_config(str(config_path))
+
+    assert providers.all_names() == ["traveltime", "google"]
+
+
+def test_providers_survive_deepcopy_and_pickle():
+    providers = Providers(
+        base=Provider(
+            name="traveltime",
+            max_rpm=60,
+            credentials=Credentials(app_id="<your-app-id>", api_key="<your-api-key>"),
+            api_endpoint=None,
+        ),
+        competitors=[
+            Provider(
+                name="google",
+                max_rpm=60,
+                credentials=Credentials("<your-api-key>"),
+                api_endpoint="some-custom-endpoint.com",
+            )
+        ],
+    )
+
+    assert copy.deepcopy(providers) == providers
+    assert pickle.loads(pickle.dumps(providers)) == providers
+
+
+def test_providers_have_no_instance_dict():
+    provider = Provider(
+        name="google",
+        max_rpm=60,
+        credentials=Credentials("<your-api-key>"),
+        api_endpoint=None,
+    )
+    providers = Providers(base=provider, competitors=[])
+
+    assert not hasattr(provider, "__dict__")
+    assert not hasattr(providers, "__dict__")